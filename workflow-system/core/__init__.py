@@ -3,32 +3,37 @@ PinkFlow Workflow System - Core Module
 
 This module provides the core functionality for creating and managing
 dynamic workflows with node-based routing and conditional logic.
+
+Public names are resolved lazily (PEP 562), so importing ``core`` does not
+load the feedback workflow or manager modules until they are first used.
 """
 
-from .workflow import (
-    Workflow,
-    WorkflowBuilder,
-    Node,
-    Edge,
-    EdgeCondition,
-    NodeType,
-    Environment,
-    EdgeConditionType,
-    NodeMetadata
-)
-from .workflow_manager import (
-    WorkflowManager,
-    WorkflowRegistry
-)
-from .feedback_workflow import (
-    FeedbackWorkflowOrchestrator,
-    FeedbackMetadata,
-    FeedbackStatus,
-    VideoValidator,
-    VideoFormat,
-    CloudStorageAdapter,
-    PubSubNotifier
-)
+import importlib
+
+# Maps each public name to the submodule that defines it
+_LAZY_IMPORTS = {
+    'Workflow': '.workflow',
+    'WorkflowBuilder': '.workflow',
+    'Node': '.workflow',
+    'Edge': '.workflow',
+    'EdgeCondition': '.workflow',
+    'NodeType': '.workflow',
+    'Environment': '.workflow',
+    'EdgeConditionType': '.workflow',
+    'NodeMetadata': '.workflow',
+    'WorkflowManager': '.workflow_manager',
+    'WorkflowRegistry': '.workflow_manager',
+    'FeedbackWorkflowOrchestrator': '.feedback_workflow',
+    'FeedbackMetadata': '.feedback_workflow',
+    'FeedbackStatus': '.feedback_workflow',
+    'VideoValidator': '.feedback_workflow',
+    'VideoProbe': '.feedback_workflow',
+    'VideoFormat': '.feedback_workflow',
+    'CloudStorageAdapter': '.feedback_workflow',
+    'UploadResult': '.feedback_workflow',
+    'StorageConfigError': '.feedback_workflow',
+    'PubSubNotifier': '.feedback_workflow',
+}
 
 __all__ = [
     'Workflow',
@@ -46,9 +51,28 @@ __all__ = [
     'FeedbackMetadata',
     'FeedbackStatus',
     'VideoValidator',
+    'VideoProbe',
     'VideoFormat',
     'CloudStorageAdapter',
+    'UploadResult',
+    'StorageConfigError',
     'PubSubNotifier',
 ]
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily-loaded names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
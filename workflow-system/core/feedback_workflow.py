@@ -13,14 +13,56 @@ Features:
 """
 
 from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlparse
+import asyncio
+import hashlib
+import hmac
 import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard library
+    orjson = None
 
-class FeedbackStatus(Enum):
-    """Status of feedback processing."""
+logger = logging.getLogger(__name__)
+
+
+def _dumps(payload: Dict[str, Any], pretty: bool = False) -> str:
+    """Serialize a notification payload to JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    # Same layout as orjson: compact separators, non-ASCII text left unescaped
+    if pretty:
+        return json.dumps(payload, indent=2, ensure_ascii=False)
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+
+
+# Signed URL expiries are rounded up to this many seconds so repeated
+# requests within the window share one signature
+SIGNED_URL_BUCKET_SECONDS = 60
+
+
+@lru_cache(maxsize=8192)
+def _sign(video_url: str, expires_at: int, secret_key: str) -> str:
+    """HMAC-SHA256 signature of a URL and its absolute expiry time."""
+    message = f"{video_url}:{expires_at}".encode()
+    return hmac.new(secret_key.encode(), message, hashlib.sha256).hexdigest()
+
+
+class FeedbackStatus(str, Enum):
+    """Status of feedback processing (members compare equal to their string values)."""
     UPLOADING = "uploading"
     PROCESSING = "processing"
     READY = "ready"
@@ -28,13 +70,39 @@ class FeedbackStatus(Enum):
     DELETED = "deleted"
 
 
-class VideoFormat(Enum):
-    """Supported video formats."""
+class VideoFormat(str, Enum):
+    """Supported video formats (members compare equal to their string values)."""
     MP4 = "mp4"
     MOV = "mov"
     WEBM = "webm"
 
 
+class _Resolution:
+    """
+    Descriptor presenting a metadata object's width and height as "WIDTHxHEIGHT".
+    
+    Assigning a "WIDTHxHEIGHT" string sets width and height. Any other string
+    leaves them unknown (None), and assigning None leaves them unchanged, so
+    the dataclass default does not clear dimensions passed alongside it.
+    """
+    
+    def __get__(self, instance: Optional['FeedbackMetadata'], owner: type = None) -> Optional[str]:
+        if instance is None:
+            return None  # the dataclass field default
+        if instance.width is None or instance.height is None:
+            return None
+        return f"{instance.width}x{instance.height}"
+    
+    def __set__(self, instance: 'FeedbackMetadata', value: Optional[str]) -> None:
+        if value is None:
+            return
+        width, _, height = value.lower().partition('x')
+        try:
+            instance.width, instance.height = int(width), int(height)
+        except ValueError:
+            instance.width = instance.height = None
+
+
 @dataclass
 class FeedbackMetadata:
     """Metadata for sign language feedback."""
@@ -47,10 +115,15 @@ class FeedbackMetadata:
     thumbnail_url: Optional[str] = None
     duration: float = 0.0
     file_size: int = 0
-    resolution: Optional[str] = None
     codec: Optional[str] = None
     frame_rate: Optional[int] = None
     views: int = 0
+    width: Optional[int] = None
+    height: Optional[int] = None
+    # Derived from width and height; declared after them so a resolution
+    # passed to the constructor is applied last
+    resolution: Optional[str] = _Resolution()
+    content_hash: Optional[str] = None  # SHA-256 of the video, for dedupe
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert metadata to dictionary."""
@@ -64,10 +137,13 @@ class FeedbackMetadata:
             'thumbnail_url': self.thumbnail_url,
             'duration': self.duration,
             'file_size': self.file_size,
+            'width': self.width,
+            'height': self.height,
             'resolution': self.resolution,
             'codec': self.codec,
             'frame_rate': self.frame_rate,
-            'views': self.views
+            'views': self.views,
+            'content_hash': self.content_hash
         }
 
 
@@ -79,8 +155,16 @@ class VideoValidator:
     MIN_DURATION = 1.0  # 1 second
     MAX_DURATION = 300.0  # 5 minutes
     
-    # Supported formats
-    SUPPORTED_FORMATS = {'.mp4', '.mov', '.webm'}
+    # Supported formats (lowercase, with leading dot)
+    SUPPORTED_FORMATS = frozenset({'.mp4', '.mov', '.webm'})
+    _SUPPORTED_EXTENSIONS = frozenset(fmt[1:] for fmt in SUPPORTED_FORMATS)
+    _ERR_UNSUPPORTED_FORMAT = (
+        f"Unsupported format. Supported formats: {', '.join(sorted(SUPPORTED_FORMATS))}"
+    )
+    _ERR_EMPTY = "File is empty"
+    _ERR_TOO_BIG = f"File size exceeds {MAX_FILE_SIZE / (1024*1024):.0f}MB limit"
+    _ERR_TOO_SHORT = f"Video too short. Minimum duration: {MIN_DURATION}s"
+    _ERR_TOO_LONG = f"Video too long. Maximum duration: {MAX_DURATION}s"
     
     @classmethod
     def validate_file_size(cls, file_size: int) -> tuple[bool, Optional[str]]:
@@ -94,9 +178,9 @@ class VideoValidator:
             Tuple of (is_valid, error_message)
         """
         if file_size <= 0:
-            return False, "File is empty"
+            return False, cls._ERR_EMPTY
         if file_size > cls.MAX_FILE_SIZE:
-            return False, f"File size exceeds {cls.MAX_FILE_SIZE / (1024*1024):.0f}MB limit"
+            return False, cls._ERR_TOO_BIG
         return True, None
     
     @classmethod
@@ -110,12 +194,10 @@ class VideoValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        extension = filename.lower().split('.')[-1] if '.' in filename else ''
-        extension = f'.{extension}'
+        _, dot, extension = filename.rpartition('.')
         
-        if extension not in cls.SUPPORTED_FORMATS:
-            supported = ', '.join(cls.SUPPORTED_FORMATS)
-            return False, f"Unsupported format. Supported formats: {supported}"
+        if not dot or extension.lower() not in cls._SUPPORTED_EXTENSIONS:
+            return False, cls._ERR_UNSUPPORTED_FORMAT
         return True, None
     
     @classmethod
@@ -130,9 +212,9 @@ class VideoValidator:
             Tuple of (is_valid, error_message)
         """
         if duration < cls.MIN_DURATION:
-            return False, f"Video too short. Minimum duration: {cls.MIN_DURATION}s"
+            return False, cls._ERR_TOO_SHORT
         if duration > cls.MAX_DURATION:
-            return False, f"Video too long. Maximum duration: {cls.MAX_DURATION}s"
+            return False, cls._ERR_TOO_LONG
         return True, None
     
     @classmethod
@@ -167,6 +249,156 @@ class VideoValidator:
                 errors.append(error)
         
         return len(errors) == 0, errors
+    
+    @classmethod
+    def validate_all_fast(cls, filename: str, file_size: int, duration: Optional[float] = None) -> Optional[str]:
+        """
+        Validate all aspects of the video file in a single pass.
+        
+        Stops at the first failure instead of collecting every error, which
+        keeps the common all-valid case free of intermediate tuples and lists.
+        
+        Args:
+            filename: Name of the file
+            file_size: Size of the file in bytes
+            duration: Duration in seconds (optional)
+            
+        Returns:
+            None if the file is valid, otherwise the first error message
+        """
+        _, dot, extension = filename.rpartition('.')
+        if not dot or extension.lower() not in cls._SUPPORTED_EXTENSIONS:
+            return cls._ERR_UNSUPPORTED_FORMAT
+        if file_size <= 0:
+            return cls._ERR_EMPTY
+        if file_size > cls.MAX_FILE_SIZE:
+            return cls._ERR_TOO_BIG
+        if duration is not None:
+            if duration < cls.MIN_DURATION:
+                return cls._ERR_TOO_SHORT
+            if duration > cls.MAX_DURATION:
+                return cls._ERR_TOO_LONG
+        return None
+
+
+class VideoProbe:
+    """
+    Extracts technical metadata (duration, codec, resolution, frame rate)
+    from video files.
+    
+    Uses PyAV, which links the FFmpeg libraries in-process, so probing a file
+    does not fork an ffprobe subprocess per upload. When PyAV is not
+    installed, probing is skipped and no metadata is returned.
+    """
+    
+    @classmethod
+    def probe(cls, file_path: str) -> Dict[str, Any]:
+        """
+        Probe a video file.
+        
+        Args:
+            file_path: Local path to the video file
+            
+        Returns:
+            Dictionary with 'duration', 'codec', 'width', 'height' and
+            'frame_rate', or an empty dictionary if the file could not be
+            probed
+        """
+        try:
+            import av
+        except ImportError:
+            return {}
+        
+        if not os.path.isfile(file_path):
+            return {}
+        
+        try:
+            with av.open(file_path) as container:
+                stream = container.streams.video[0]
+                if stream.duration is not None:
+                    duration = float(stream.duration * stream.time_base)
+                elif container.duration is not None:
+                    duration = container.duration / av.time_base
+                else:
+                    duration = 0.0
+                
+                return {
+                    'duration': duration,
+                    'codec': stream.codec_context.name,
+                    'width': stream.width,
+                    'height': stream.height,
+                    'frame_rate': round(stream.average_rate) if stream.average_rate else None
+                }
+        except (IndexError, OSError, av.error.FFmpegError):
+            # No video stream, unreadable file or undecodable container
+            return {}
+    
+    @classmethod
+    def extract_thumbnail(cls, file_path: str, output_path: str, timestamp_ms: int = 1500) -> bool:
+        """
+        Write a JPEG thumbnail of a single frame of the video.
+        
+        Seeks straight to the requested timestamp instead of decoding every
+        frame from the start, so the cost does not grow with video length.
+        Falls back to the first frame for videos shorter than the timestamp.
+        
+        Args:
+            file_path: Local path to the video file
+            output_path: Path to write the JPEG thumbnail to
+            timestamp_ms: Position of the frame to capture, in milliseconds
+            
+        Returns:
+            True if the thumbnail was written, False if OpenCV is not
+            installed, no frame could be read or OpenCV raised an error
+        """
+        try:
+            import cv2
+        except ImportError:
+            return False
+        
+        capture = cv2.VideoCapture(file_path)
+        try:
+            if not capture.isOpened():
+                return False
+            
+            capture.set(cv2.CAP_PROP_POS_MSEC, timestamp_ms)
+            ok, frame = capture.read()
+            if not ok:
+                capture.set(cv2.CAP_PROP_POS_MSEC, 0)
+                ok, frame = capture.read()
+            if not ok:
+                return False
+            
+            return cv2.imwrite(output_path, frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+        except cv2.error as e:
+            # A thumbnail is optional, so a decode or encode failure is not fatal
+            logger.warning("Could not extract a thumbnail from %s: %s", file_path, e)
+            return False
+        finally:
+            capture.release()
+
+
+class StorageConfigError(ValueError):
+    """Raised when the storage configuration is missing a required setting."""
+
+
+@dataclass(frozen=True)
+class UploadResult:
+    """
+    Outcome of CloudStorageAdapter.try_upload_video().
+    
+    Attributes:
+        urls: upload_video() result ('video_url', 'thumbnail_url' and
+            'content_hash') if the upload succeeded
+        error: Error message if the upload failed
+    """
+    urls: Optional[Dict[str, Optional[str]]] = None
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the upload succeeded."""
+        return self.error is None
 
 
 class CloudStorageAdapter:
@@ -180,6 +412,16 @@ class CloudStorageAdapter:
     - Azure Blob Storage
     """
     
+    # Multipart upload tuning for the 'aws_s3' provider. Part size and
+    # concurrency are derived from the file size unless set in the config.
+    MULTIPART_THRESHOLD = 16 * 1024 * 1024  # 16 MB, smaller files use put_object
+    MIN_PART_SIZE = 5 * 1024 * 1024  # 5 MB, the S3 minimum
+    TARGET_PART_COUNT = 1000
+    BYTES_PER_WORKER = 16 * 1024 * 1024  # 16 MB
+    MIN_CONCURRENCY = 4
+    MAX_CONCURRENCY = 32
+    DEFAULT_MAX_POOL_CONNECTIONS = 64
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize storage adapter.
@@ -189,26 +431,284 @@ class CloudStorageAdapter:
         """
         self.config = config
         self.provider = config.get('provider', 'local')
+        self._s3_client = None
+        self._client_lock = threading.Lock()
+        # Part buffers reused across multipart uploads
+        self._buffer_pool: "queue.LifoQueue[bytearray]" = queue.LifoQueue(
+            maxsize=config.get('max_concurrency', self.MAX_CONCURRENCY)
+        )
+        # Presigned S3 URLs, keyed by (object key, expiry bucket)
+        self._presign_s3 = lru_cache(maxsize=8192)(self._presign_s3_uncached)
     
-    def upload_video(self, file_path: str, feedback_id: str) -> Dict[str, str]:
+    @property
+    def uploads_thumbnails(self) -> bool:
+        """Whether upload_video stores the thumbnail it is given."""
+        return self.provider == 'aws_s3'
+    
+    def upload_video(self,
+                     file_path: str,
+                     feedback_id: str,
+                     thumbnail_path: Optional[str] = None) -> Dict[str, str]:
         """
         Upload video to cloud storage.
         
         Args:
             file_path: Local path to the video file
             feedback_id: Unique identifier for the feedback
+            thumbnail_path: Optional local path to a generated thumbnail
             
         Returns:
-            Dictionary with 'video_url' and 'thumbnail_url'
+            Dictionary with 'video_url', 'thumbnail_url' and 'content_hash'
+            (SHA-256 of the video, or None if the provider did not read it)
         """
-        # Placeholder implementation
-        # In production, this would use actual cloud storage SDKs
         base_url = self.config.get('base_url', 'https://storage.example.com')
+        content_hash = None
+        
+        if self.provider == 'aws_s3':
+            content_hash = self._upload_to_s3(file_path, f"feedback/{feedback_id}/video.mp4")
+            if thumbnail_path:
+                self._upload_to_s3(thumbnail_path, f"feedback/{feedback_id}/thumbnail.jpg")
+        # Other providers are still placeholders and only build the URLs
+        
         return {
             'video_url': f"{base_url}/feedback/{feedback_id}/video.mp4",
-            'thumbnail_url': f"{base_url}/feedback/{feedback_id}/thumbnail.jpg"
+            'thumbnail_url': f"{base_url}/feedback/{feedback_id}/thumbnail.jpg",
+            'content_hash': content_hash
         }
     
+    def try_upload_video(self,
+                         file_path: str,
+                         feedback_id: str,
+                         thumbnail_path: Optional[str] = None) -> UploadResult:
+        """
+        Upload video to cloud storage, reporting expected failures as a result.
+        
+        Only I/O, configuration, missing-dependency and storage-service errors
+        are turned into a failed result; anything else is a bug and propagates.
+        
+        Args:
+            file_path: Local path to the video file
+            feedback_id: Unique identifier for the feedback
+            thumbnail_path: Optional local path to a generated thumbnail
+            
+        Returns:
+            UploadResult with the upload_video result, or the error message
+        """
+        try:
+            return UploadResult(urls=self.upload_video(file_path, feedback_id, thumbnail_path))
+        except self._upload_errors() as e:
+            return UploadResult(error=f"Upload failed: {e}")
+    
+    @staticmethod
+    def _upload_errors() -> tuple:
+        """Exception types that indicate an upload failure rather than a bug."""
+        try:
+            from botocore.exceptions import BotoCoreError, ClientError
+        except ImportError:
+            return (OSError, ImportError, StorageConfigError)
+        return (OSError, ImportError, StorageConfigError, BotoCoreError, ClientError)
+    
+    def _upload_to_s3(self, file_path: str, key: str) -> str:
+        """
+        Upload a file to S3, using concurrent multipart transfers for large files.
+        
+        The file is read once; its SHA-256 is computed from the same buffers
+        that are sent, so no separate checksum pass is needed.
+        
+        Args:
+            file_path: Local path to the file
+            key: Destination object key within the configured bucket
+            
+        Returns:
+            Hex SHA-256 digest of the file contents
+            
+        Raises:
+            ImportError: If boto3 is not installed
+            StorageConfigError: If no bucket is configured
+        """
+        client = self._get_s3_client()
+        bucket = self._bucket()
+        file_size = os.path.getsize(file_path)
+        
+        if file_size <= self.config.get('multipart_threshold', self.MULTIPART_THRESHOLD):
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            client.put_object(Bucket=bucket, Key=key, Body=data)
+            return hashlib.sha256(data).hexdigest()
+        
+        part_size, max_concurrency = self._multipart_settings(file_size)
+        upload_id = client.create_multipart_upload(Bucket=bucket, Key=key)['UploadId']
+        
+        # Bounds the parts held in memory to the number being uploaded
+        in_flight = threading.BoundedSemaphore(max_concurrency)
+        content_hash = hashlib.sha256()
+        futures = []
+        try:
+            with open(file_path, 'rb') as f, ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                part_number = 1
+                while True:
+                    in_flight.acquire()
+                    buffer = self._acquire_buffer(part_size)
+                    size = f.readinto(buffer)
+                    if not size:
+                        self._release_buffer(buffer)
+                        in_flight.release()
+                        break
+                    
+                    content_hash.update(memoryview(buffer)[:size])
+                    futures.append(executor.submit(
+                        self._upload_part, client, bucket, key, upload_id,
+                        part_number, buffer, size, in_flight
+                    ))
+                    part_number += 1
+            
+            parts = [future.result() for future in futures]
+        except BaseException:
+            client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            raise
+        
+        client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': parts}
+        )
+        return content_hash.hexdigest()
+    
+    def _multipart_settings(self, file_size: int) -> tuple[int, int]:
+        """
+        Choose the part size and concurrency for a multipart upload.
+        
+        Parts are sized to keep roughly TARGET_PART_COUNT parts per file (never
+        below MIN_PART_SIZE, rounded up to a whole MB so pooled buffers are
+        reused), with one worker per BYTES_PER_WORKER clamped to
+        [MIN_CONCURRENCY, MAX_CONCURRENCY]. 'part_size' and 'max_concurrency'
+        in the config override the computed values.
+        
+        Args:
+            file_size: Size of the file in bytes
+            
+        Returns:
+            Tuple of (part_size, max_concurrency)
+        """
+        part_size = self.config.get('part_size')
+        if part_size is None:
+            mb = 1024 * 1024
+            part_size = max(self.MIN_PART_SIZE, -(-file_size // self.TARGET_PART_COUNT))
+            part_size = -(-part_size // mb) * mb
+        
+        max_concurrency = self.config.get('max_concurrency')
+        if max_concurrency is None:
+            max_concurrency = min(
+                self.MAX_CONCURRENCY,
+                max(self.MIN_CONCURRENCY, file_size // self.BYTES_PER_WORKER)
+            )
+        
+        return part_size, max_concurrency
+    
+    def _upload_part(self,
+                     client: Any,
+                     bucket: str,
+                     key: str,
+                     upload_id: str,
+                     part_number: int,
+                     buffer: bytearray,
+                     size: int,
+                     in_flight: threading.BoundedSemaphore) -> Dict[str, Any]:
+        """
+        Upload one multipart part from a pooled buffer, then return the buffer.
+        
+        Returns:
+            Part descriptor for complete_multipart_upload
+        """
+        try:
+            # Full parts are sent straight from the pooled buffer; only the
+            # short final part is copied
+            body = buffer if size == len(buffer) else bytes(buffer[:size])
+            response = client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+            return {'ETag': response['ETag'], 'PartNumber': part_number}
+        finally:
+            self._release_buffer(buffer)
+            in_flight.release()
+    
+    def _acquire_buffer(self, size: int) -> bytearray:
+        """Take a part buffer from the pool, allocating one if none fits."""
+        try:
+            buffer = self._buffer_pool.get_nowait()
+        except queue.Empty:
+            return bytearray(size)
+        if len(buffer) != size:
+            # Part size changed since the buffer was pooled
+            return bytearray(size)
+        return buffer
+    
+    def _release_buffer(self, buffer: bytearray) -> None:
+        """Return a part buffer to the pool for reuse by later parts."""
+        try:
+            self._buffer_pool.put_nowait(buffer)
+        except queue.Full:
+            pass
+    
+    def _bucket(self) -> str:
+        """
+        Return the configured S3 bucket.
+        
+        Raises:
+            StorageConfigError: If the config has no 'bucket'
+        """
+        bucket = self.config.get('bucket')
+        if not bucket:
+            raise StorageConfigError("The 'aws_s3' provider requires a 'bucket' in the storage config")
+        return bucket
+    
+    def _get_s3_client(self) -> Any:
+        """
+        Return the shared S3 client, creating it on first use.
+        
+        A single client (and its connection pool) is reused for every
+        upload, delete and signing call so TLS connections stay warm.
+        
+        Raises:
+            ImportError: If boto3 is not installed
+        """
+        if self._s3_client is not None:
+            return self._s3_client
+        
+        with self._client_lock:
+            if self._s3_client is None:
+                try:
+                    import boto3
+                    from botocore.config import Config
+                except ImportError as e:
+                    raise ImportError("The 'aws_s3' provider requires boto3: pip install boto3") from e
+                
+                self._s3_client = boto3.client(
+                    's3',
+                    region_name=self.config.get('region'),
+                    aws_access_key_id=self.config.get('access_key_id'),
+                    aws_secret_access_key=self.config.get('secret_access_key'),
+                    config=Config(
+                        max_pool_connections=self.config.get(
+                            'max_pool_connections', self.DEFAULT_MAX_POOL_CONNECTIONS
+                        ),
+                        retries={'max_attempts': 3, 'mode': 'adaptive'}
+                    )
+                )
+        return self._s3_client
+    
+    def _object_key(self, url: str) -> str:
+        """Derive the storage object key from a public object URL."""
+        base_url = self.config.get('base_url', 'https://storage.example.com')
+        if url.startswith(base_url + '/'):
+            return url[len(base_url) + 1:]
+        return urlparse(url).path.lstrip('/')
+    
     def delete_video(self, video_url: str) -> bool:
         """
         Delete video from cloud storage.
@@ -219,13 +719,22 @@ class CloudStorageAdapter:
         Returns:
             True if deletion was successful
         """
-        # Placeholder implementation
+        if self.provider == 'aws_s3':
+            self._get_s3_client().delete_object(
+                Bucket=self._bucket(),
+                Key=self._object_key(video_url)
+            )
+        # Other providers are still placeholders
         return True
     
     def generate_signed_url(self, video_url: str, expiration: int = 3600) -> str:
         """
         Generate a signed URL for secure video access.
         
+        Expiry is rounded up to the next SIGNED_URL_BUCKET_SECONDS boundary so
+        that signatures can be cached; URLs may stay valid up to that much
+        longer than requested.
+        
         Args:
             video_url: URL of the video
             expiration: Expiration time in seconds
@@ -233,8 +742,96 @@ class CloudStorageAdapter:
         Returns:
             Signed URL
         """
+        expires_at = -(-(int(time.time()) + expiration) // SIGNED_URL_BUCKET_SECONDS)
+        expires_at *= SIGNED_URL_BUCKET_SECONDS
+        
+        if self.provider == 'aws_s3':
+            return self._presign_s3(self._object_key(video_url), expires_at)
+        
+        signing_key = self.config.get('signing_key')
+        if signing_key:
+            signature = _sign(video_url, expires_at, signing_key)
+            return f"{video_url}?expires={expires_at}&signature={signature}"
+        
         # Placeholder implementation
         return f"{video_url}?token=signed_token&expires={expiration}"
+    
+    def _presign_s3_uncached(self, key: str, expires_at: int) -> str:
+        """Presign a GET for an S3 object, valid until expires_at."""
+        return self._get_s3_client().generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self._bucket(), 'Key': key},
+            ExpiresIn=max(expires_at - int(time.time()), 1)
+        )
+
+
+class _NotificationFlusher:
+    """
+    Background thread that coalesces queued notifications into batches.
+    
+    A batch is handed to ``publish_batch`` once it holds ``max_batch`` events
+    or ``max_delay_ms`` has passed since its first event arrived.
+    """
+    
+    def __init__(self,
+                 publish_batch: Callable[[List[tuple]], None],
+                 max_batch: int = 128,
+                 max_delay_ms: float = 5):
+        self.publish_batch = publish_batch
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._flush_loop, name='pubsub-flusher', daemon=True)
+        self._thread.start()
+    
+    def put(self, event: str, data: Dict[str, Any]) -> None:
+        """Queue one notification for the next batch."""
+        self._queue.put((event, data))
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far has been published."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self) -> None:
+        """Publish any pending notifications and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+    
+    def _flush_loop(self) -> None:
+        """Collect queued notifications into batches until closed."""
+        running = True
+        while running:
+            batch = []
+            markers = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.max_delay
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    # flush() marker: publish what we have without waiting
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if not running or markers or len(batch) >= self.max_batch:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            if batch:
+                try:
+                    self.publish_batch(batch)
+                except Exception:
+                    logger.exception("[PubSub] Batch publish failed")
+            for marker in markers:
+                marker.set()
 
 
 class PubSubNotifier:
@@ -244,6 +841,16 @@ class PubSubNotifier:
     Integrates with Phoenix PubSub or similar real-time systems.
     """
     
+    EVENT_UPLOADED = 'feedback:uploaded'
+    EVENT_PROCESSED = 'feedback:processed'
+    EVENT_DELETED = 'feedback:deleted'
+    
+    # Compact envelope text preceding the serialized data, per event
+    _ENVELOPE_PREFIXES = {
+        event: _dumps({'event': event, 'data': 0})[:-2]
+        for event in (EVENT_UPLOADED, EVENT_PROCESSED, EVENT_DELETED)
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize PubSub notifier.
@@ -253,6 +860,14 @@ class PubSubNotifier:
         """
         self.config = config
         self.enabled = config.get('enabled', True)
+        self.debug = config.get('debug', False)  # pretty-print payloads
+        self._flusher: Optional[_NotificationFlusher] = None
+        if config.get('batching', False):
+            self._flusher = _NotificationFlusher(
+                self._publish_batch,
+                max_batch=config.get('max_batch', 128),
+                max_delay_ms=config.get('max_delay_ms', 5)
+            )
     
     def notify_upload(self, feedback_metadata: FeedbackMetadata) -> bool:
         """
@@ -267,14 +882,8 @@ class PubSubNotifier:
         if not self.enabled:
             return False
         
-        # Placeholder implementation
         # In production, this would publish to actual PubSub channel
-        notification = {
-            'event': 'feedback:uploaded',
-            'data': feedback_metadata.to_dict()
-        }
-        print(f"[PubSub] Publishing: {json.dumps(notification, indent=2)}")
-        return True
+        return self._publish(self.EVENT_UPLOADED, feedback_metadata.to_dict())
     
     def notify_processing_complete(self, feedback_id: str, status: FeedbackStatus, metadata: Dict[str, Any]) -> bool:
         """
@@ -291,16 +900,11 @@ class PubSubNotifier:
         if not self.enabled:
             return False
         
-        notification = {
-            'event': 'feedback:processed',
-            'data': {
-                'feedback_id': feedback_id,
-                'status': status.value,
-                **metadata
-            }
-        }
-        print(f"[PubSub] Publishing: {json.dumps(notification, indent=2)}")
-        return True
+        return self._publish(self.EVENT_PROCESSED, {
+            'feedback_id': feedback_id,
+            'status': status.value,
+            **metadata
+        })
     
     def notify_deletion(self, feedback_id: str, deleted_by: str) -> bool:
         """
@@ -316,16 +920,80 @@ class PubSubNotifier:
         if not self.enabled:
             return False
         
-        notification = {
-            'event': 'feedback:deleted',
-            'data': {
-                'feedback_id': feedback_id,
-                'deleted_by': deleted_by,
-                'timestamp': datetime.now().isoformat()
-            }
-        }
-        print(f"[PubSub] Publishing: {json.dumps(notification, indent=2)}")
+        return self._publish(self.EVENT_DELETED, {
+            'feedback_id': feedback_id,
+            'deleted_by': deleted_by,
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all batched notifications have been published.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            True if the queue was drained within the timeout
+        """
+        if self._flusher is None:
+            return True
+        return self._flusher.flush(timeout)
+    
+    def close(self) -> None:
+        """Publish any batched notifications and stop the background flusher."""
+        if self._flusher is not None:
+            self._flusher.close()
+            self._flusher = None
+    
+    def _publish(self, event: str, data: Dict[str, Any]) -> bool:
+        """
+        Publish an event payload, or queue it when batching is enabled.
+        
+        Args:
+            event: Event name (one of the EVENT_* constants)
+            data: Event data
+            
+        Returns:
+            True if notification was sent or queued
+        """
+        if self._flusher is not None:
+            self._flusher.put(event, data)
+            return True
+        
+        # Placeholder implementation: payloads are only logged, so skip
+        # serialization entirely unless DEBUG logging is enabled
+        if not logger.isEnabledFor(logging.DEBUG):
+            return True
+        
+        logger.debug("[PubSub] Publishing: %s", self._encode(event, data))
         return True
+    
+    def _publish_batch(self, batch: List[tuple]) -> None:
+        """
+        Publish a batch of (event, data) pairs as a single message.
+        
+        In production, this would be one pipelined publish per channel.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        if self.debug:
+            message = _dumps([{'event': event, 'data': data} for event, data in batch], pretty=True)
+        else:
+            message = f"[{','.join(self._encode(event, data) for event, data in batch)}]"
+        logger.debug("[PubSub] Publishing batch of %d: %s", len(batch), message)
+    
+    def _encode(self, event: str, data: Dict[str, Any]) -> str:
+        """
+        Serialize one event envelope.
+        
+        The envelope around ``data`` is pre-serialized per event, so only the
+        data itself is encoded on each call.
+        """
+        if self.debug:
+            return _dumps({'event': event, 'data': data}, pretty=True)
+        return f"{self._ENVELOPE_PREFIXES[event]}{_dumps(data)}}}"
 
 
 class FeedbackWorkflowOrchestrator:
@@ -351,6 +1019,83 @@ class FeedbackWorkflowOrchestrator:
         self.storage = CloudStorageAdapter(storage_config)
         self.pubsub = PubSubNotifier(pubsub_config)
         self.validator = VideoValidator()
+        self.probe = VideoProbe()
+    
+    def _validate(self,
+                  feedback_metadata: FeedbackMetadata,
+                  filename: str,
+                  file_size: int) -> Optional[Dict[str, Any]]:
+        """
+        Validate an upload, returning the failure result if it is invalid.
+        
+        The single-pass check handles the common valid case; the full error
+        list is only collected once the upload is known to be invalid.
+        
+        Args:
+            feedback_metadata: Metadata of the upload being validated
+            filename: Original filename
+            file_size: File size in bytes
+            
+        Returns:
+            Failure result dictionary, or None if the upload is valid
+        """
+        if self.validator.validate_all_fast(filename, file_size) is None:
+            return None
+        
+        _, errors = self.validator.validate_all(filename, file_size)
+        feedback_metadata.status = FeedbackStatus.FAILED
+        return {
+            'success': False,
+            'errors': errors,
+            'metadata': feedback_metadata.to_dict()
+        }
+    
+    @staticmethod
+    def _upload_failure(feedback_metadata: FeedbackMetadata, error: str) -> Dict[str, Any]:
+        """Mark the feedback as failed and build the upload failure result."""
+        feedback_metadata.status = FeedbackStatus.FAILED
+        return {
+            'success': False,
+            'errors': [error],
+            'metadata': feedback_metadata.to_dict()
+        }
+    
+    def _upload_video(self, file_path: str, feedback_id: str) -> UploadResult:
+        """
+        Upload the video, with a thumbnail if the storage provider keeps one.
+        
+        The thumbnail is written to a temporary file that is removed once the
+        upload has finished. Failing to produce a thumbnail does not fail the
+        upload; the video is then uploaded without one.
+        
+        Returns:
+            Result of CloudStorageAdapter.try_upload_video
+        """
+        if not self.storage.uploads_thumbnails:
+            return self.storage.try_upload_video(file_path, feedback_id)
+        
+        try:
+            fd, thumbnail_path = tempfile.mkstemp(suffix='.jpg')
+        except OSError as e:
+            # A thumbnail is optional; upload the video without one
+            logger.warning("Could not create a thumbnail file: %s", e)
+            return self.storage.try_upload_video(file_path, feedback_id)
+        os.close(fd)
+        try:
+            if not self.probe.extract_thumbnail(file_path, thumbnail_path):
+                return self.storage.try_upload_video(file_path, feedback_id)
+            return self.storage.try_upload_video(file_path, feedback_id, thumbnail_path)
+        finally:
+            try:
+                os.remove(thumbnail_path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _apply_video_info(feedback_metadata: FeedbackMetadata, video_info: Dict[str, Any]) -> None:
+        """Copy probed video properties onto the feedback metadata."""
+        for name, value in video_info.items():
+            setattr(feedback_metadata, name, value)
     
     def process_upload(self, 
                       file_path: str, 
@@ -382,38 +1127,29 @@ class FeedbackWorkflowOrchestrator:
         )
         
         # Step 1: Validate
-        is_valid, errors = self.validator.validate_all(filename, file_size)
-        if not is_valid:
-            feedback_metadata.status = FeedbackStatus.FAILED
-            return {
-                'success': False,
-                'errors': errors,
-                'metadata': feedback_metadata.to_dict()
-            }
+        failure = self._validate(feedback_metadata, filename, file_size)
+        if failure:
+            return failure
         
         # Step 2: Upload to cloud storage
-        try:
-            feedback_id = f"feedback_{user_id}_{int(datetime.now().timestamp())}"
-            storage_result = self.storage.upload_video(file_path, feedback_id)
-            
-            feedback_metadata.video_url = storage_result['video_url']
-            feedback_metadata.thumbnail_url = storage_result['thumbnail_url']
-            feedback_metadata.status = FeedbackStatus.PROCESSING
-            
-        except Exception as e:
-            feedback_metadata.status = FeedbackStatus.FAILED
-            return {
-                'success': False,
-                'errors': [f"Upload failed: {str(e)}"],
-                'metadata': feedback_metadata.to_dict()
-            }
+        feedback_id = f"feedback_{user_id}_{time.time_ns()}"
+        upload = self._upload_video(file_path, feedback_id)
+        if not upload.ok:
+            return self._upload_failure(feedback_metadata, upload.error)
+        storage_result = upload.urls
+        
+        feedback_metadata.video_url = storage_result['video_url']
+        feedback_metadata.thumbnail_url = storage_result['thumbnail_url']
+        feedback_metadata.content_hash = storage_result['content_hash']
+        feedback_metadata.status = FeedbackStatus.PROCESSING
         
         # Step 3: Notify admins via PubSub
         self.pubsub.notify_upload(feedback_metadata)
         
-        # Step 4: Queue for video processing
-        # In production, this would trigger async video processing
-        # (transcoding, thumbnail generation, duration extraction)
+        # Step 4: Extract video metadata
+        # In production, transcoding would also be queued here
+        video_info = self.probe.probe(file_path)
+        self._apply_video_info(feedback_metadata, video_info)
         
         feedback_metadata.status = FeedbackStatus.READY
         
@@ -423,7 +1159,8 @@ class FeedbackWorkflowOrchestrator:
             FeedbackStatus.READY,
             {
                 'video_url': feedback_metadata.video_url,
-                'thumbnail_url': feedback_metadata.thumbnail_url
+                'thumbnail_url': feedback_metadata.thumbnail_url,
+                **video_info
             }
         )
         
@@ -433,6 +1170,83 @@ class FeedbackWorkflowOrchestrator:
             'metadata': feedback_metadata.to_dict()
         }
     
+    async def process_upload_async(self,
+                                   file_path: str,
+                                   filename: str,
+                                   file_size: int,
+                                   user_id: str,
+                                   description: Optional[str] = None,
+                                   tags: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Process a new feedback upload without blocking the event loop.
+        
+        Behaves like process_upload, but runs the storage upload in a worker
+        thread and publishes the upload and processing-complete notifications
+        concurrently instead of one after the other.
+        
+        Args:
+            file_path: Path to the uploaded file
+            filename: Original filename
+            file_size: File size in bytes
+            user_id: ID of the user uploading
+            description: Optional description
+            tags: Optional tags
+            
+        Returns:
+            Dictionary with processing result
+        """
+        feedback_metadata = FeedbackMetadata(
+            user_id=user_id,
+            description=description,
+            tags=tags or [],
+            file_size=file_size
+        )
+        
+        failure = self._validate(feedback_metadata, filename, file_size)
+        if failure:
+            return failure
+        
+        feedback_id = f"feedback_{user_id}_{time.time_ns()}"
+        # Probing only reads the local file, so it overlaps the upload
+        upload, video_info = await asyncio.gather(
+            asyncio.to_thread(self._upload_video, file_path, feedback_id),
+            asyncio.to_thread(self.probe.probe, file_path)
+        )
+        if not upload.ok:
+            return self._upload_failure(feedback_metadata, upload.error)
+        storage_result = upload.urls
+        
+        feedback_metadata.video_url = storage_result['video_url']
+        feedback_metadata.thumbnail_url = storage_result['thumbnail_url']
+        feedback_metadata.content_hash = storage_result['content_hash']
+        feedback_metadata.status = FeedbackStatus.PROCESSING
+        
+        # The upload notification must report the PROCESSING state, so it
+        # gets a snapshot taken before the status moves on to READY
+        uploaded_snapshot = replace(feedback_metadata)
+        self._apply_video_info(feedback_metadata, video_info)
+        feedback_metadata.status = FeedbackStatus.READY
+        
+        await asyncio.gather(
+            asyncio.to_thread(self.pubsub.notify_upload, uploaded_snapshot),
+            asyncio.to_thread(
+                self.pubsub.notify_processing_complete,
+                feedback_id,
+                FeedbackStatus.READY,
+                {
+                    'video_url': feedback_metadata.video_url,
+                    'thumbnail_url': feedback_metadata.thumbnail_url,
+                    **video_info
+                }
+            )
+        )
+        
+        return {
+            'success': True,
+            'feedback_id': feedback_id,
+            'metadata': feedback_metadata.to_dict()
+        }
+    
     def delete_feedback(self, feedback_id: str, video_url: str, deleted_by: str) -> Dict[str, Any]:
         """
         Delete feedback and associated video.
@@ -477,10 +1291,13 @@ CREATE TABLE sign_language_feedback (
     status VARCHAR(50) NOT NULL DEFAULT 'processing',
     duration FLOAT DEFAULT 0,
     file_size BIGINT DEFAULT 0,
-    resolution VARCHAR(50),
+    width INTEGER,
+    height INTEGER,
+    resolution VARCHAR(50),  -- "WIDTHxHEIGHT", derived from width and height
     codec VARCHAR(50),
     frame_rate INTEGER,
     views INTEGER DEFAULT 0,
+    content_hash CHAR(64),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     deleted_at TIMESTAMP,
@@ -493,7 +1310,8 @@ CREATE TABLE sign_language_feedback (
     INDEX idx_user_id (user_id),
     INDEX idx_status (status),
     INDEX idx_created_at (created_at),
-    INDEX idx_tags (tags)
+    INDEX idx_tags (tags),
+    INDEX idx_content_hash (content_hash)
 );
 
 -- Feedback Views Table (for analytics)
@@ -511,26 +1329,26 @@ CREATE TABLE feedback_views (
 """
 
 
-# Configuration examples
-EXAMPLE_AWS_S3_CONFIG = {
+# Configuration examples (read-only; copy with dict(...) before modifying)
+EXAMPLE_AWS_S3_CONFIG = MappingProxyType({
     'provider': 'aws_s3',
     'bucket': 'pinkflow-feedback',
     'region': 'us-east-1',
     'access_key_id': 'YOUR_ACCESS_KEY',
     'secret_access_key': 'YOUR_SECRET_KEY',
     'base_url': 'https://pinkflow-feedback.s3.amazonaws.com'
-}
+})
 
-EXAMPLE_FIREBASE_CONFIG = {
+EXAMPLE_FIREBASE_CONFIG = MappingProxyType({
     'provider': 'firebase',
     'bucket': 'pinkflow-feedback.appspot.com',
     'credentials_path': '/path/to/firebase-credentials.json',
     'base_url': 'https://firebasestorage.googleapis.com'
-}
+})
 
-EXAMPLE_PUBSUB_CONFIG = {
+EXAMPLE_PUBSUB_CONFIG = MappingProxyType({
     'enabled': True,
     'type': 'phoenix_pubsub',  # or 'redis_pubsub', 'kafka', etc.
     'channel': 'feedback:notifications',
     'admin_channel': 'admin:notifications'
-}
+})
@@ -12,15 +12,23 @@ Features:
 - Modular and extensible design
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
+from bisect import bisect_right
+from collections import ChainMap, deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
+import operator
+import sys
 
+# Per-instance __dict__ is dropped for the graph dataclasses where supported
+# (dataclass(slots=True) needs Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-class NodeType(Enum):
-    """Defines the types of nodes in the workflow."""
+
+class NodeType(str, Enum):
+    """Defines the types of nodes in the workflow (members compare equal to their string values)."""
     START = "start"
     PROCESS = "process"
     DECISION = "decision"
@@ -29,16 +37,16 @@ class NodeType(Enum):
     MERGE = "merge"
 
 
-class Environment(Enum):
-    """Defines the deployment environments."""
+class Environment(str, Enum):
+    """Defines the deployment environments (members compare equal to their string values)."""
     SANDBOX = "sandbox"
     STAGING = "staging"
     PRODUCTION = "production"
     DEVELOPMENT = "development"
 
 
-class EdgeConditionType(Enum):
-    """Defines types of conditions for edge routing."""
+class EdgeConditionType(str, Enum):
+    """Defines types of conditions for edge routing (members compare equal to their string values)."""
     ALWAYS = "always"
     EQUALS = "equals"
     NOT_EQUALS = "not_equals"
@@ -48,17 +56,24 @@ class EdgeConditionType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class NodeMetadata:
     """Metadata for workflow nodes."""
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None  # defaults to the creation time
+    updated_at: Optional[datetime] = None  # defaults to created_at
     tags: List[str] = field(default_factory=list)
     description: str = ""
     owner: str = ""
+    
+    def __post_init__(self) -> None:
+        """Fill in timestamps with a single clock read."""
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        if self.updated_at is None:
+            self.updated_at = self.created_at
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EdgeCondition:
     """
     Represents a condition for edge traversal.
@@ -84,34 +99,49 @@ class EdgeCondition:
         Returns:
             True if condition is met, False otherwise
         """
-        if self.condition_type == EdgeConditionType.ALWAYS:
-            return True
-        
-        if self.condition_type == EdgeConditionType.CUSTOM:
-            if self.custom_function:
-                return self.custom_function(context)
+        return _CONDITION_EVALUATORS[self.condition_type](self, context)
+
+
+_MISSING = object()
+
+
+def _evaluate_always(condition: EdgeCondition, context: Dict[str, Any]) -> bool:
+    """Unconditional edges are always traversable."""
+    return True
+
+
+def _evaluate_custom(condition: EdgeCondition, context: Dict[str, Any]) -> bool:
+    """Delegate to the condition's custom function, if any."""
+    if condition.custom_function:
+        return condition.custom_function(context)
+    return False
+
+
+def _field_comparison(compare: Callable[[Any, Any], bool]) -> Callable[[EdgeCondition, Dict[str, Any]], bool]:
+    """Build an evaluator comparing a context field against the condition value."""
+    def evaluate(condition: EdgeCondition, context: Dict[str, Any]) -> bool:
+        if condition.field is None:
             return False
-        
-        if self.field is None or self.field not in context:
+        field_value = context.get(condition.field, _MISSING)
+        if field_value is _MISSING:
             return False
-        
-        field_value = context[self.field]
-        
-        if self.condition_type == EdgeConditionType.EQUALS:
-            return field_value == self.value
-        elif self.condition_type == EdgeConditionType.NOT_EQUALS:
-            return field_value != self.value
-        elif self.condition_type == EdgeConditionType.GREATER_THAN:
-            return field_value > self.value
-        elif self.condition_type == EdgeConditionType.LESS_THAN:
-            return field_value < self.value
-        elif self.condition_type == EdgeConditionType.CONTAINS:
-            return self.value in field_value
-        
-        return False
+        return compare(field_value, condition.value)
+    return evaluate
 
 
-@dataclass
+# Evaluator per condition type, looked up once per evaluate() call
+_CONDITION_EVALUATORS: Dict[EdgeConditionType, Callable[[EdgeCondition, Dict[str, Any]], bool]] = {
+    EdgeConditionType.ALWAYS: _evaluate_always,
+    EdgeConditionType.CUSTOM: _evaluate_custom,
+    EdgeConditionType.EQUALS: _field_comparison(operator.eq),
+    EdgeConditionType.NOT_EQUALS: _field_comparison(operator.ne),
+    EdgeConditionType.GREATER_THAN: _field_comparison(operator.gt),
+    EdgeConditionType.LESS_THAN: _field_comparison(operator.lt),
+    EdgeConditionType.CONTAINS: _field_comparison(operator.contains),
+}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Edge:
     """
     Represents a directed edge between two nodes.
@@ -136,7 +166,7 @@ class Edge:
         return self.condition.evaluate(context)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Node:
     """
     Represents a node in the workflow.
@@ -171,6 +201,73 @@ class Node:
         return context
 
 
+class _NodeLayer(ChainMap):
+    """
+    Writable per-node view of the shared context in a parallel wave.
+    
+    Writes land in the node's own top mapping, as with a plain ChainMap.
+    Deleting a key that only exists in the shared context hides it from the
+    node and records it in ``deleted``, so the deletion can be merged back.
+    """
+    
+    def __init__(self, context: Dict[str, Any]):
+        super().__init__({}, context)
+        self.deleted: set = set()
+    
+    def __getitem__(self, key: Any) -> Any:
+        if key in self.deleted:
+            return self.__missing__(key)
+        return super().__getitem__(key)
+    
+    def __contains__(self, key: Any) -> bool:
+        return key not in self.deleted and super().__contains__(key)
+    
+    def __iter__(self):
+        return (key for key in super().__iter__() if key not in self.deleted)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __bool__(self) -> bool:
+        return any(True for _ in self)
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.deleted.discard(key)
+        self.maps[0][key] = value
+    
+    def __delitem__(self, key: Any) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.maps[0].pop(key, None)
+        if key in self.maps[1]:
+            self.deleted.add(key)
+    
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        del self[key]
+        return value
+    
+    def popitem(self) -> Tuple[Any, Any]:
+        for key in self:
+            value = self[key]
+            del self[key]
+            return key, value
+        raise KeyError('popitem(): context is empty')
+    
+    def clear(self) -> None:
+        for key in list(self):
+            del self[key]
+    
+    def copy(self) -> Dict[str, Any]:
+        return dict(self)
+    
+    __copy__ = copy
+
+
 class Workflow:
     """
     Main workflow orchestrator that manages nodes, edges, and execution.
@@ -201,6 +298,10 @@ class Workflow:
         self.description = description
         self.nodes: Dict[str, Node] = {}
         self.edges: List[Edge] = []
+        # Outgoing edges per source node, each list ordered by priority
+        self._out_edges: Dict[str, List[Edge]] = {}
+        # Negated priorities parallel to _out_edges, for bisecting on insert
+        self._out_priorities: Dict[str, List[int]] = {}
         self.start_node: Optional[str] = None
         self.end_nodes: List[str] = []
         self.created_at = datetime.now()
@@ -244,6 +345,12 @@ class Workflow:
             raise ValueError(f"Destination node '{edge.to_node}' does not exist")
         
         self.edges.append(edge)
+        
+        # Insert after any edges of equal priority, so ties keep insertion order
+        priorities = self._out_priorities.setdefault(edge.from_node, [])
+        index = bisect_right(priorities, -edge.priority)
+        priorities.insert(index, -edge.priority)
+        self._out_edges.setdefault(edge.from_node, []).insert(index, edge)
     
     def connect_nodes(
         self,
@@ -285,8 +392,22 @@ class Workflow:
         Returns:
             List of outgoing edges, sorted by priority (descending)
         """
-        outgoing = [e for e in self.edges if e.from_node == node_id]
-        return sorted(outgoing, key=lambda e: e.priority, reverse=True)
+        return list(self._sorted_out_edges(node_id))
+    
+    def _sorted_out_edges(self, node_id: str) -> List[Edge]:
+        """Return the priority-ordered outgoing edges of a node, re-sorting if a priority changed."""
+        edges = self._out_edges.get(node_id, [])
+        priorities = self._out_priorities.get(node_id)
+        if priorities is not None and [-edge.priority for edge in edges] != priorities:
+            # An edge's priority was reassigned after it was added
+            edges = sorted(
+                (edge for edge in self.edges if edge.from_node == node_id),
+                key=lambda edge: edge.priority,
+                reverse=True
+            )
+            self._out_edges[node_id] = edges
+            self._out_priorities[node_id] = [-edge.priority for edge in edges]
+        return edges
     
     def get_next_nodes(self, current_node_id: str, context: Dict[str, Any]) -> List[str]:
         """
@@ -299,26 +420,36 @@ class Workflow:
         Returns:
             List of next node IDs that can be traversed
         """
-        outgoing_edges = self.get_outgoing_edges(current_node_id)
-        next_nodes = []
-        
-        for edge in outgoing_edges:
-            if edge.can_traverse(context):
-                next_nodes.append(edge.to_node)
-        
-        return next_nodes
+        # ALWAYS edges are taken without calling evaluate()
+        return [
+            edge.to_node
+            for edge in self._sorted_out_edges(current_node_id)
+            if edge.condition.condition_type is EdgeConditionType.ALWAYS
+            or edge.condition.evaluate(context)
+        ]
     
     def execute(
         self,
         initial_context: Optional[Dict[str, Any]] = None,
-        max_iterations: int = 1000
+        max_iterations: int = 1000,
+        max_workers: int = 1
     ) -> Dict[str, Any]:
         """
         Execute the workflow starting from the start node.
         
+        With max_workers > 1, the nodes of each wave (the nodes reached in the
+        same step) run concurrently in a thread pool, which helps when their
+        actions block on I/O. Each node then receives its own writable layer
+        (a ChainMap) over the shared context. The keys it sets or deletes are
+        merged back in wave order, so a later node's change to a key wins.
+        An action that returns a new mapping is treated as having set the
+        keys it contains and deleted the ones it left out, as in serial
+        execution. Actions must not mutate shared nested values in place.
+        
         Args:
             initial_context: Initial context for workflow execution
             max_iterations: Maximum number of node visits to prevent infinite loops
+            max_workers: Number of threads used to run the nodes of a wave
             
         Returns:
             Final execution context
@@ -336,30 +467,34 @@ class Workflow:
         
         current_nodes = [self.start_node]
         iterations = 0
+        executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
         
-        while current_nodes and iterations < max_iterations:
-            iterations += 1
-            next_nodes = []
-            
-            for node_id in current_nodes:
-                if node_id not in self.nodes:
-                    continue
-                
-                node = self.nodes[node_id]
-                context['execution_path'].append(node_id)
-                
-                # Execute node action
-                context = node.execute(context)
+        try:
+            while current_nodes and iterations < max_iterations:
+                iterations += 1
                 
-                # Check if we've reached an end node
-                if node.node_type == NodeType.END:
-                    continue
+                wave = [self.nodes[node_id] for node_id in current_nodes if node_id in self.nodes]
+                if executor is not None and len(wave) > 1:
+                    context, next_nodes = self._execute_wave_parallel(wave, context, executor)
+                else:
+                    next_nodes = []
+                    for node in wave:
+                        context['execution_path'].append(node.node_id)
+                        
+                        # Execute node action
+                        context = node.execute(context)
+                        
+                        # Check if we've reached an end node
+                        if node.node_type == NodeType.END:
+                            continue
+                        
+                        # Determine next nodes
+                        next_nodes.extend(self.get_next_nodes(node.node_id, context))
                 
-                # Determine next nodes
-                next_node_ids = self.get_next_nodes(node_id, context)
-                next_nodes.extend(next_node_ids)
-            
-            current_nodes = next_nodes
+                current_nodes = next_nodes
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         if iterations >= max_iterations:
             raise ValueError(f"Workflow exceeded maximum iterations ({max_iterations})")
@@ -368,6 +503,51 @@ class Workflow:
         context['iterations'] = iterations
         return context
     
+    def _execute_wave_parallel(
+        self,
+        wave: List[Node],
+        context: Dict[str, Any],
+        executor: ThreadPoolExecutor
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Run the nodes of one wave concurrently and merge their results.
+        
+        Args:
+            wave: Nodes to execute
+            context: Execution context at the start of the wave
+            executor: Thread pool to run node actions in
+            
+        Returns:
+            Tuple of (merged context, next node IDs)
+        """
+        context['execution_path'].extend(node.node_id for node in wave)
+        # Writes land in each node's own top layer, so nothing is copied
+        # per node and the layer holds exactly that node's changes
+        layers = [_NodeLayer(context) for _ in wave]
+        futures = [executor.submit(node.execute, layer) for node, layer in zip(wave, layers)]
+        
+        merged = dict(context)
+        next_nodes = []
+        for node, layer, future in zip(wave, layers, futures):
+            result = future.result()
+            if result is layer:
+                merged.update(layer.maps[0])
+                deleted = layer.deleted
+            else:
+                # The action built a new mapping: keep the keys it set or
+                # replaced, and drop the ones it left out
+                for key, value in result.items():
+                    if context.get(key, _MISSING) is not value:
+                        merged[key] = value
+                deleted = context.keys() - result.keys()
+            for key in deleted:
+                merged.pop(key, None)
+            
+            if node.node_type != NodeType.END:
+                next_nodes.extend(self.get_next_nodes(node.node_id, result))
+        
+        return merged, next_nodes
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Export workflow to dictionary format.
@@ -421,6 +601,9 @@ class Workflow:
         Returns:
             JSON string representation of the workflow
         """
+        # Imported here so loading the workflow core does not pull in json
+        import json
+        
         return json.dumps(self.to_dict(), indent=indent)
     
     def validate(self) -> List[str]:
@@ -441,14 +624,14 @@ class Workflow:
         # Check for unreachable nodes
         reachable = set()
         if self.start_node:
-            to_visit = [self.start_node]
+            reachable.add(self.start_node)
+            to_visit = deque([self.start_node])
             while to_visit:
-                current = to_visit.pop()
-                if current in reachable:
-                    continue
-                reachable.add(current)
-                for edge in self.get_outgoing_edges(current):
-                    to_visit.append(edge.to_node)
+                current = to_visit.popleft()
+                for edge in self._out_edges.get(current, ()):
+                    if edge.to_node not in reachable:
+                        reachable.add(edge.to_node)
+                        to_visit.append(edge.to_node)
         
         unreachable = set(self.nodes.keys()) - reachable
         if unreachable:
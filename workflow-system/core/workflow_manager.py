@@ -5,13 +5,43 @@ This module provides the workflow management system for registering, executing,
 and managing multiple workflows across different environments.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, List, Optional, Any
+from collections import Counter, deque
+from collections.abc import Sequence
 from datetime import datetime
-import json
-from pathlib import Path
+from itertools import islice
 
 from .workflow import Workflow, Environment
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _ExecutionHistoryView(Sequence):
+    """Read-only, non-copying view of a registry's execution records."""
+    
+    __slots__ = ('_records',)
+    
+    def __init__(self, records: Deque[Dict[str, Any]]):
+        self._records = records
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._records)[index]
+        return self._records[index]
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._records)
+    
+    def __reversed__(self) -> Iterator[Dict[str, Any]]:
+        return reversed(self._records)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._records)!r})"
+
 
 class WorkflowRegistry:
     """
@@ -21,10 +51,31 @@ class WorkflowRegistry:
     across different environments and use cases.
     """
     
-    def __init__(self):
-        """Initialize a new workflow registry."""
+    # Default number of execution records kept; older records are discarded
+    MAX_HISTORY = 100_000
+    
+    def __init__(self, max_history: int = MAX_HISTORY):
+        """
+        Initialize a new workflow registry.
+        
+        Args:
+            max_history: Maximum number of execution records to keep (0 keeps none)
+        """
         self.workflows: Dict[str, Workflow] = {}
-        self.execution_history: List[Dict[str, Any]] = []
+        self.max_history = max_history
+        self._execution_history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
+        # Per-workflow view of the records in _execution_history, for
+        # filtered lookups; records leave it only when the global deque evicts them
+        self._history_by_workflow: Dict[str, Deque[Dict[str, Any]]] = {}
+        # Running counts over the records currently in _execution_history
+        self._status_counts: Counter = Counter()
+        self._environment_counts: Counter = Counter()
+        self._history_view = _ExecutionHistoryView(self._execution_history)
+    
+    @property
+    def execution_history(self) -> Sequence:
+        """Read-only view of all execution records, oldest first."""
+        return self._history_view
     
     def register(self, workflow: Workflow) -> None:
         """
@@ -119,17 +170,45 @@ class WorkflowRegistry:
         execution_end = datetime.now()
         
         # Record execution history
-        self.execution_history.append({
+        record = {
             'workflow_id': workflow_id,
             'started_at': execution_start.isoformat(),
             'completed_at': execution_end.isoformat(),
             'duration_seconds': (execution_end - execution_start).total_seconds(),
             'status': result.get('execution_status', 'unknown'),
             'environment': workflow.environment.value
-        })
+        }
+        self._record_execution(record)
         
         return result
     
+    def _record_execution(self, record: Dict[str, Any]) -> None:
+        """Append an execution record, keeping the running counts in step."""
+        if self._execution_history.maxlen == 0:
+            return
+        
+        if len(self._execution_history) == self._execution_history.maxlen:
+            # The oldest record is about to be evicted by the append
+            evicted = self._execution_history[0]
+            self._status_counts[evicted['status']] -= 1
+            self._environment_counts[evicted['environment']] -= 1
+            
+            # The evicted record is the oldest of its workflow's records
+            evicted_history = self._history_by_workflow.get(evicted['workflow_id'])
+            if evicted_history and evicted_history[0] is evicted:
+                evicted_history.popleft()
+                if not evicted_history:
+                    del self._history_by_workflow[evicted['workflow_id']]
+        
+        self._execution_history.append(record)
+        workflow_history = self._history_by_workflow.get(record['workflow_id'])
+        if workflow_history is None:
+            workflow_history = deque()
+            self._history_by_workflow[record['workflow_id']] = workflow_history
+        workflow_history.append(record)
+        self._status_counts[record['status']] += 1
+        self._environment_counts[record['environment']] += 1
+    
     def get_execution_history(
         self,
         workflow_id: Optional[str] = None,
@@ -143,22 +222,40 @@ class WorkflowRegistry:
             limit: Maximum number of records to return
             
         Returns:
-            List of execution records
+            List of execution records, oldest first
         """
-        history = self.execution_history
+        history = self._execution_history
         
         if workflow_id:
-            history = [h for h in history if h['workflow_id'] == workflow_id]
+            history = self._history_by_workflow.get(workflow_id, ())
         
-        return history[-limit:]
+        # Walk back from the newest record so only `limit` records are visited
+        records = list(islice(reversed(history), limit))
+        records.reverse()
+        return records
     
-    def export_workflows(self, filepath: Path) -> None:
+    def get_execution_counts(self) -> Dict[str, Any]:
+        """
+        Get counts over the execution records currently kept.
+        
+        Returns:
+            Dictionary with the total and per-status and per-environment counts
+        """
+        return {
+            'total': len(self._execution_history),
+            'by_status': dict(self._status_counts),
+            'by_environment': dict(self._environment_counts)
+        }
+    
+    def export_workflows(self, filepath: 'Path') -> None:
         """
         Export all workflows to a JSON file.
         
         Args:
             filepath: Path to save the JSON file
         """
+        import json
+        
         data = {
             'workflows': [w.to_dict() for w in self.workflows.values()],
             'exported_at': datetime.now().isoformat()
@@ -282,7 +379,7 @@ class WorkflowManager:
         """Get configuration for an environment."""
         return self.environment_configs.get(environment, {}).copy()
     
-    def export_to_file(self, filepath: Path) -> None:
+    def export_to_file(self, filepath: 'Path') -> None:
         """Export all workflows to a file."""
         self.registry.export_workflows(filepath)
     
@@ -294,19 +391,26 @@ class WorkflowManager:
             Dictionary with workflow statistics
         """
         workflows = self.registry.list()
-        history = self.registry.execution_history
+        execution_counts = self.registry.get_execution_counts()
+        
+        # Workflows are few and their environment can be reassigned after
+        # registration, so they are counted here; execution counts are
+        # maintained by the registry as records are added
+        workflow_counts = Counter(w.environment for w in workflows)
+        status_counts = execution_counts['by_status']
+        environment_counts = execution_counts['by_environment']
         
         return {
             'total_workflows': len(workflows),
             'workflows_by_environment': {
-                env.value: len([w for w in workflows if w.environment == env])
+                env.value: workflow_counts[env]
                 for env in Environment
             },
-            'total_executions': len(history),
-            'successful_executions': len([h for h in history if h['status'] == 'success']),
-            'failed_executions': len([h for h in history if h['status'] == 'failed']),
+            'total_executions': execution_counts['total'],
+            'successful_executions': status_counts.get('success', 0),
+            'failed_executions': status_counts.get('failed', 0),
             'executions_by_environment': {
-                env.value: len([h for h in history if h['environment'] == env.value])
+                env.value: environment_counts.get(env.value, 0)
                 for env in Environment
             }
         }
@@ -6,6 +6,7 @@ and patterns for the PinkFlow workflow system.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -20,6 +21,27 @@ from core.workflow import (
 )
 
 
+def emit(context, message):
+    """
+    Log a node's message.
+    
+    When the caller passes a list in context['_log'], lines are buffered
+    there and written out in one go once the workflow finishes, instead of
+    a print() per node. Otherwise the line is printed immediately.
+    """
+    log = context.get('_log')
+    if log is None:
+        print(message)
+    else:
+        log.append(message)
+
+
+# The factories below are cached: each workflow is built once and later calls
+# return the same instance. Executing a workflow does not modify it, so the
+# shared instance can be run repeatedly, but it should not be extended in place.
+
+
+@lru_cache(maxsize=None)
 def create_development_cycle_workflow():
     """
     Create a complete development cycle workflow.
@@ -36,13 +58,13 @@ def create_development_cycle_workflow():
         context['phase'] = 'development'
         context['code_quality'] = 0
         context['tests_passed'] = False
-        print(f"[{context['environment']}] Starting development cycle...")
+        emit(context, f"[{context['environment']}] Starting development cycle...")
         return context
     
     def write_code(context):
         """Simulate code writing."""
         context['code_quality'] = 85  # Simulated quality score
-        print(f"[{context['environment']}] Code written with quality score: {context['code_quality']}")
+        emit(context, f"[{context['environment']}] Code written with quality score: {context['code_quality']}")
         return context
     
     def run_tests(context):
@@ -50,31 +72,31 @@ def create_development_cycle_workflow():
         # Tests pass if code quality is above 70
         context['tests_passed'] = context.get('code_quality', 0) > 70
         test_status = "PASSED" if context['tests_passed'] else "FAILED"
-        print(f"[{context['environment']}] Tests {test_status}")
+        emit(context, f"[{context['environment']}] Tests {test_status}")
         return context
     
     def code_review(context):
         """Perform code review."""
         context['review_approved'] = context.get('code_quality', 0) > 75
         review_status = "APPROVED" if context['review_approved'] else "REJECTED"
-        print(f"[{context['environment']}] Code review {review_status}")
+        emit(context, f"[{context['environment']}] Code review {review_status}")
         return context
     
     def deploy_to_staging(context):
         """Deploy to staging environment."""
         context['deployed_to'] = 'staging'
-        print(f"[{context['environment']}] Deployed to staging")
+        emit(context, f"[{context['environment']}] Deployed to staging")
         return context
     
     def fix_issues(context):
         """Fix identified issues."""
-        print(f"[{context['environment']}] Fixing issues...")
+        emit(context, f"[{context['environment']}] Fixing issues...")
         context['code_quality'] = min(100, context.get('code_quality', 0) + 20)
         return context
     
     def complete_cycle(context):
         """Complete the development cycle."""
-        print(f"[{context['environment']}] Development cycle completed")
+        emit(context, f"[{context['environment']}] Development cycle completed")
         return context
     
     # Build the workflow
@@ -147,6 +169,7 @@ def create_development_cycle_workflow():
     return workflow
 
 
+@lru_cache(maxsize=None)
 def create_sandbox_workflow():
     """
     Create a sandbox environment workflow for experimentation.
@@ -158,37 +181,37 @@ def create_sandbox_workflow():
         """Initialize sandbox environment."""
         context['sandbox_id'] = 'sandbox_001'
         context['experiment_count'] = 0
-        print(f"[SANDBOX] Initialized sandbox: {context['sandbox_id']}")
+        emit(context, f"[SANDBOX] Initialized sandbox: {context['sandbox_id']}")
         return context
     
     def run_experiment(context):
         """Run an experiment in sandbox."""
         context['experiment_count'] = context.get('experiment_count', 0) + 1
         context['experiment_success'] = context['experiment_count'] <= 3
-        print(f"[SANDBOX] Running experiment #{context['experiment_count']}")
+        emit(context, f"[SANDBOX] Running experiment #{context['experiment_count']}")
         return context
     
     def validate_results(context):
         """Validate experiment results."""
         context['results_valid'] = context.get('experiment_success', False)
-        print(f"[SANDBOX] Results validation: {'VALID' if context['results_valid'] else 'INVALID'}")
+        emit(context, f"[SANDBOX] Results validation: {'VALID' if context['results_valid'] else 'INVALID'}")
         return context
     
     def promote_to_staging(context):
         """Promote successful experiments to staging."""
-        print(f"[SANDBOX] Promoting to staging environment")
+        emit(context, f"[SANDBOX] Promoting to staging environment")
         context['promoted'] = True
         return context
     
     def rollback_changes(context):
         """Rollback failed experiments."""
-        print(f"[SANDBOX] Rolling back changes")
+        emit(context, f"[SANDBOX] Rolling back changes")
         context['rolled_back'] = True
         return context
     
     def cleanup_sandbox(context):
         """Cleanup sandbox resources."""
-        print(f"[SANDBOX] Cleaning up sandbox: {context.get('sandbox_id', 'unknown')}")
+        emit(context, f"[SANDBOX] Cleaning up sandbox: {context.get('sandbox_id', 'unknown')}")
         return context
     
     workflow = (
@@ -234,6 +257,7 @@ def create_sandbox_workflow():
     return workflow
 
 
+@lru_cache(maxsize=None)
 def create_staging_deployment_workflow():
     """
     Create a staging deployment workflow with quality gates.
@@ -250,12 +274,12 @@ def create_staging_deployment_workflow():
         context['checks_passed'] = True
         context['security_scan'] = 'passed'
         context['dependencies'] = 'up_to_date'
-        print(f"[STAGING] Pre-deployment checks completed")
+        emit(context, f"[STAGING] Pre-deployment checks completed")
         return context
     
     def deploy_to_staging(context):
         """Deploy to staging environment."""
-        print(f"[STAGING] Deploying to staging environment")
+        emit(context, f"[STAGING] Deploying to staging environment")
         context['staging_url'] = 'https://staging.pinkflow.dev'
         context['deployed'] = True
         return context
@@ -263,26 +287,26 @@ def create_staging_deployment_workflow():
     def run_smoke_tests(context):
         """Run smoke tests."""
         context['smoke_tests_passed'] = True
-        print(f"[STAGING] Smoke tests completed")
+        emit(context, f"[STAGING] Smoke tests completed")
         return context
     
     def performance_tests(context):
         """Run performance tests."""
         context['performance_score'] = 92
         context['performance_acceptable'] = context['performance_score'] > 80
-        print(f"[STAGING] Performance score: {context['performance_score']}")
+        emit(context, f"[STAGING] Performance score: {context['performance_score']}")
         return context
     
     def ready_for_production(context):
         """Mark as ready for production."""
         context['production_ready'] = True
-        print(f"[STAGING] Approved for production deployment")
+        emit(context, f"[STAGING] Approved for production deployment")
         return context
     
     def requires_tuning(context):
         """Mark as requiring tuning."""
         context['needs_tuning'] = True
-        print(f"[STAGING] Requires performance tuning")
+        emit(context, f"[STAGING] Requires performance tuning")
         return context
     
     workflow = (
@@ -328,6 +352,7 @@ def create_staging_deployment_workflow():
     return workflow
 
 
+@lru_cache(maxsize=None)
 def create_production_deployment_workflow():
     """
     Create a production deployment workflow with strict controls.
@@ -343,49 +368,49 @@ def create_production_deployment_workflow():
         """Verify all required approvals."""
         context['approvals'] = ['tech_lead', 'security', 'product_owner']
         context['all_approved'] = len(context['approvals']) >= 3
-        print(f"[PRODUCTION] Approvals verified: {context['approvals']}")
+        emit(context, f"[PRODUCTION] Approvals verified: {context['approvals']}")
         return context
     
     def backup_current_state(context):
         """Backup current production state."""
         context['backup_id'] = 'backup_20250108_001'
-        print(f"[PRODUCTION] Created backup: {context['backup_id']}")
+        emit(context, f"[PRODUCTION] Created backup: {context['backup_id']}")
         return context
     
     def canary_deployment(context):
         """Deploy to canary instances (10% traffic)."""
         context['canary_deployed'] = True
         context['canary_traffic_percent'] = 10
-        print(f"[PRODUCTION] Canary deployment: {context['canary_traffic_percent']}% traffic")
+        emit(context, f"[PRODUCTION] Canary deployment: {context['canary_traffic_percent']}% traffic")
         return context
     
     def monitor_canary(context):
         """Monitor canary deployment."""
         context['canary_error_rate'] = 0.5  # 0.5% error rate
         context['canary_healthy'] = context['canary_error_rate'] < 1.0
-        print(f"[PRODUCTION] Canary error rate: {context['canary_error_rate']}%")
+        emit(context, f"[PRODUCTION] Canary error rate: {context['canary_error_rate']}%")
         return context
     
     def full_deployment(context):
         """Deploy to all production instances."""
         context['deployment_complete'] = True
-        print(f"[PRODUCTION] Full deployment completed")
+        emit(context, f"[PRODUCTION] Full deployment completed")
         return context
     
     def rollback_deployment(context):
         """Rollback to previous version."""
-        print(f"[PRODUCTION] Rolling back to backup: {context.get('backup_id', 'unknown')}")
+        emit(context, f"[PRODUCTION] Rolling back to backup: {context.get('backup_id', 'unknown')}")
         context['rolled_back'] = True
         return context
     
     def notify_success(context):
         """Send success notifications."""
-        print(f"[PRODUCTION] Deployment successful - notifications sent")
+        emit(context, f"[PRODUCTION] Deployment successful - notifications sent")
         return context
     
     def notify_failure(context):
         """Send failure notifications."""
-        print(f"[PRODUCTION] Deployment failed - notifications sent")
+        emit(context, f"[PRODUCTION] Deployment failed - notifications sent")
         return context
     
     workflow = (
@@ -460,8 +485,14 @@ def main():
         print(f"Description: {workflow.description}")
         print(f"{'=' * 80}\n")
         
+        log = []
         try:
-            result = workflow.execute()
+            try:
+                result = workflow.execute({'_log': log})
+            finally:
+                # Written even if execution fails, keeping the trace up to the failure
+                if log:
+                    sys.stdout.write("\n".join(log) + "\n")
             print(f"\n✓ Workflow completed successfully")
             print(f"  - Iterations: {result.get('iterations', 0)}")
             print(f"  - Path: {' → '.join(result.get('execution_path', []))}")
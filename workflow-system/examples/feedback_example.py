@@ -7,6 +7,8 @@ with the workflow orchestrator.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -23,6 +25,116 @@ from core.feedback_workflow import (
 )
 
 
+_BANNER = "\n".join([
+    "╔" + "=" * 78 + "╗",
+    "║" + " " * 20 + "PinkFlow Sign Language Feedback System" + " " * 20 + "║",
+    "║" + " " * 30 + "Example Usage" + " " * 35 + "║",
+    "╚" + "=" * 78 + "╝",
+])
+
+_SUMMARY = "\n".join([
+    "=" * 80,
+    "All examples completed!",
+    "=" * 80,
+    "",
+    "Next Steps:",
+    "  1. Integrate with actual cloud storage (AWS S3, Firebase, etc.)",
+    "  2. Connect to database for persistence",
+    "  3. Implement Phoenix PubSub for real-time notifications",
+    "  4. Add video processing pipeline (transcoding, thumbnails)",
+    "  5. Build frontend UI with React/Next.js",
+    "  6. Add authentication and authorization",
+    "  7. Implement admin dashboard",
+    "  8. Add analytics and monitoring",
+    "",
+])
+
+_AWS_S3_DOC = """
+AWS S3 Configuration Example:
+```python
+storage_config = {
+    'provider': 'aws_s3',
+    'bucket': 'pinkflow-feedback',
+    'region': 'us-east-1',
+    'access_key_id': 'YOUR_ACCESS_KEY',
+    'secret_access_key': 'YOUR_SECRET_KEY',
+    'base_url': 'https://pinkflow-feedback.s3.amazonaws.com'
+}
+```
+
+Note: In production, you would:
+  1. Install boto3 for AWS S3 integration
+  2. Set up IAM roles with appropriate permissions
+  3. Configure CORS settings on the S3 bucket
+  4. Implement proper error handling and retries
+  5. Use CloudFront for CDN distribution"""
+
+_FIREBASE_DOC = """
+Firebase Storage Configuration Example:
+```python
+storage_config = {
+    'provider': 'firebase',
+    'bucket': 'pinkflow-feedback.appspot.com',
+    'credentials_path': '/path/to/firebase-credentials.json',
+    'base_url': 'https://firebasestorage.googleapis.com'
+}
+```
+
+Note: In production, you would:
+  1. Install firebase-admin SDK
+  2. Set up Firebase project and storage rules
+  3. Configure authentication and authorization
+  4. Implement security rules for video access
+  5. Use Firebase Cloud Functions for processing"""
+
+_DEAF_FIRST_DOC = """
+Deaf-First Design Principles for Feedback System:
+
+1. Visual Communication Priority
+   - Sign language videos are the PRIMARY form of feedback
+   - Text descriptions are OPTIONAL and supplementary
+   - Video player must have accessible controls
+
+2. Accessibility Features
+   - High-contrast video player controls
+   - Keyboard navigation support
+   - Clear visual indicators for upload progress
+   - Error messages with visual icons
+
+3. Technical Considerations
+   - High-quality video encoding (preserve sign details)
+   - Fast loading times (minimize buffering)
+   - Multiple resolution options
+   - Thumbnail selection showing clear hand positions
+
+4. User Experience
+   - Simple, visual upload interface
+   - Preview before upload
+   - Clear feedback on upload status
+   - Easy retake/re-record option
+
+5. Admin Dashboard
+   - Video preview without auto-play (user control)
+   - Visual tags and categorization
+   - Batch processing capabilities
+   - Response system supporting sign language replies
+"""
+
+
+@lru_cache(maxsize=None)
+def get_orchestrator():
+    """
+    Get the orchestrator shared by the examples.
+    
+    It is built on first use with local storage and mock PubSub, so the
+    examples do not each pay for their own adapters.
+    """
+    return FeedbackWorkflowOrchestrator(
+        {'provider': 'local', 'base_url': 'https://storage.pinkflow.dev'},
+        {'enabled': True, 'type': 'mock'}
+    )
+
+
 def example_basic_upload():
     """
     Example 1: Basic feedback upload workflow
@@ -31,18 +143,7 @@ def example_basic_upload():
     print("Example 1: Basic Feedback Upload")
     print("=" * 80)
     
-    # Initialize orchestrator
-    storage_config = {
-        'provider': 'local',
-        'base_url': 'https://storage.pinkflow.dev'
-    }
-    
-    pubsub_config = {
-        'enabled': True,
-        'type': 'mock'
-    }
-    
-    orchestrator = FeedbackWorkflowOrchestrator(storage_config, pubsub_config)
+    orchestrator = get_orchestrator()
     
     # Simulate file upload
     file_path = "/tmp/sign_language_feedback.mp4"
@@ -155,10 +256,7 @@ def example_failed_upload():
     print("Example 3: Failed Upload (Validation Errors)")
     print("=" * 80)
     
-    orchestrator = FeedbackWorkflowOrchestrator(
-        {'provider': 'local', 'base_url': 'https://storage.pinkflow.dev'},
-        {'enabled': True, 'type': 'mock'}
-    )
+    orchestrator = get_orchestrator()
     
     # Try to upload invalid file
     result = orchestrator.process_upload(
@@ -187,10 +285,7 @@ def example_feedback_deletion():
     print("Example 4: Feedback Deletion")
     print("=" * 80)
     
-    orchestrator = FeedbackWorkflowOrchestrator(
-        {'provider': 'local', 'base_url': 'https://storage.pinkflow.dev'},
-        {'enabled': True, 'type': 'mock'}
-    )
+    orchestrator = get_orchestrator()
     
     # Simulate deletion
     feedback_id = "feedback_user123_1699564800"
@@ -222,24 +317,7 @@ def example_with_aws_s3():
     print("Example 5: AWS S3 Configuration (Conceptual)")
     print("=" * 80)
     
-    print("\nAWS S3 Configuration Example:")
-    print("```python")
-    print("storage_config = {")
-    print("    'provider': 'aws_s3',")
-    print("    'bucket': 'pinkflow-feedback',")
-    print("    'region': 'us-east-1',")
-    print("    'access_key_id': 'YOUR_ACCESS_KEY',")
-    print("    'secret_access_key': 'YOUR_SECRET_KEY',")
-    print("    'base_url': 'https://pinkflow-feedback.s3.amazonaws.com'")
-    print("}")
-    print("```")
-    
-    print("\nNote: In production, you would:")
-    print("  1. Install boto3 for AWS S3 integration")
-    print("  2. Set up IAM roles with appropriate permissions")
-    print("  3. Configure CORS settings on the S3 bucket")
-    print("  4. Implement proper error handling and retries")
-    print("  5. Use CloudFront for CDN distribution")
+    print(_AWS_S3_DOC)
     
     print()
 
@@ -252,22 +330,7 @@ def example_with_firebase():
     print("Example 6: Firebase Storage Configuration (Conceptual)")
     print("=" * 80)
     
-    print("\nFirebase Storage Configuration Example:")
-    print("```python")
-    print("storage_config = {")
-    print("    'provider': 'firebase',")
-    print("    'bucket': 'pinkflow-feedback.appspot.com',")
-    print("    'credentials_path': '/path/to/firebase-credentials.json',")
-    print("    'base_url': 'https://firebasestorage.googleapis.com'")
-    print("}")
-    print("```")
-    
-    print("\nNote: In production, you would:")
-    print("  1. Install firebase-admin SDK")
-    print("  2. Set up Firebase project and storage rules")
-    print("  3. Configure authentication and authorization")
-    print("  4. Implement security rules for video access")
-    print("  5. Use Firebase Cloud Functions for processing")
+    print(_FIREBASE_DOC)
     
     print()
 
@@ -280,47 +343,59 @@ def example_deaf_first_considerations():
     print("Example 7: Deaf-First Design Considerations")
     print("=" * 80)
     
-    print("\nDeaf-First Design Principles for Feedback System:")
-    print()
-    print("1. Visual Communication Priority")
-    print("   - Sign language videos are the PRIMARY form of feedback")
-    print("   - Text descriptions are OPTIONAL and supplementary")
-    print("   - Video player must have accessible controls")
-    print()
-    print("2. Accessibility Features")
-    print("   - High-contrast video player controls")
-    print("   - Keyboard navigation support")
-    print("   - Clear visual indicators for upload progress")
-    print("   - Error messages with visual icons")
-    print()
-    print("3. Technical Considerations")
-    print("   - High-quality video encoding (preserve sign details)")
-    print("   - Fast loading times (minimize buffering)")
-    print("   - Multiple resolution options")
-    print("   - Thumbnail selection showing clear hand positions")
-    print()
-    print("4. User Experience")
-    print("   - Simple, visual upload interface")
-    print("   - Preview before upload")
-    print("   - Clear feedback on upload status")
-    print("   - Easy retake/re-record option")
-    print()
-    print("5. Admin Dashboard")
-    print("   - Video preview without auto-play (user control)")
-    print("   - Visual tags and categorization")
-    print("   - Batch processing capabilities")
-    print("   - Response system supporting sign language replies")
+    print(_DEAF_FIRST_DOC)
+
+
+def example_bulk_upload():
+    """
+    Example 8: Bulk upload of several feedback videos
+    """
+    print("=" * 80)
+    print("Example 8: Bulk Upload")
+    print("=" * 80)
+    
+    orchestrator = get_orchestrator()
+    
+    files = [
+        {
+            'file_path': f"/tmp/bulk_feedback_{i}.mp4",
+            'filename': f"bulk_feedback_{i}.mp4",
+            'file_size': (5 + i) * 1024 * 1024,
+            'user_id': f"user{100 + i}",
+            'description': f"Bulk import item {i}"
+        }
+        for i in range(8)
+    ]
+    files.append({
+        'file_path': "/tmp/bulk_feedback_too_large.mp4",
+        'filename': "bulk_feedback_too_large.mp4",
+        'file_size': 150 * 1024 * 1024,
+        'user_id': "user200",
+        'description': "This one is rejected before upload"
+    })
+    
+    # Validation is cheap, so reject bad files up front and only hand the
+    # valid ones to the upload pool, where the storage I/O overlaps.
+    valid, rejected = [], []
+    for f in files:
+        error = orchestrator.validator.validate_all_fast(f['filename'], f['file_size'])
+        (rejected if error else valid).append((f, error))
+    
+    with ThreadPoolExecutor(max_workers=8) as io_pool:
+        results = list(io_pool.map(lambda item: orchestrator.process_upload(**item[0]), valid))
+    
+    print(f"\nUploaded {sum(r['success'] for r in results)} of {len(files)} files:")
+    for (f, _), result in zip(valid, results):
+        print(f"  {f['filename']}: {result['metadata']['status']}")
+    for f, error in rejected:
+        print(f"  {f['filename']}: rejected ({error})")
+    
     print()
 
 
 def main():
     """Run all examples."""
-    print("\n")
-    print("╔" + "=" * 78 + "╗")
-    print("║" + " " * 20 + "PinkFlow Sign Language Feedback System" + " " * 20 + "║")
-    print("║" + " " * 30 + "Example Usage" + " " * 35 + "║")
-    print("╚" + "=" * 78 + "╝")
-    print()
+    print("\n\n" + _BANNER + "\n")
     
     # Run all examples
     example_basic_upload()
@@ -330,21 +405,9 @@ def main():
     example_with_aws_s3()
     example_with_firebase()
     example_deaf_first_considerations()
+    example_bulk_upload()
     
-    print("=" * 80)
-    print("All examples completed!")
-    print("=" * 80)
-    print()
-    print("Next Steps:")
-    print("  1. Integrate with actual cloud storage (AWS S3, Firebase, etc.)")
-    print("  2. Connect to database for persistence")
-    print("  3. Implement Phoenix PubSub for real-time notifications")
-    print("  4. Add video processing pipeline (transcoding, thumbnails)")
-    print("  5. Build frontend UI with React/Next.js")
-    print("  6. Add authentication and authorization")
-    print("  7. Implement admin dashboard")
-    print("  8. Add analytics and monitoring")
-    print()
+    print(_SUMMARY)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,317 @@
+"""
+Simple tests to verify the sign language feedback workflow.
+Run with: python3 test_feedback_workflow.py
+"""
+
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+
+# Make the core package importable however the tests are launched
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from core import feedback_workflow
+from core.feedback_workflow import (
+    CloudStorageAdapter,
+    FeedbackStatus,
+    FeedbackWorkflowOrchestrator,
+    PubSubNotifier,
+    VideoValidator,
+    _NotificationFlusher,
+    _dumps
+)
+
+
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client calls used by uploads."""
+    
+    def __init__(self, fail_part=None):
+        self.fail_part = fail_part
+        self.parts = {}
+        self.part_body_ids = []
+        self.completed = None
+        self.aborted = False
+        self._lock = threading.Lock()
+    
+    def put_object(self, Bucket, Key, Body):
+        self.completed = {'Parts': [], 'Body': bytes(Body)}
+    
+    def create_multipart_upload(self, Bucket, Key):
+        return {'UploadId': 'upload-1'}
+    
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        if PartNumber == self.fail_part:
+            raise OSError(f"part {PartNumber} failed")
+        with self._lock:
+            self.parts[PartNumber] = bytes(Body)
+            self.part_body_ids.append(id(Body))
+        return {'ETag': f'"etag-{PartNumber}"'}
+    
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = MultipartUpload
+    
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+
+def make_adapter(client, **config):
+    """Build an 'aws_s3' adapter that talks to the given fake client."""
+    adapter = CloudStorageAdapter({'provider': 'aws_s3', 'bucket': 'videos', **config})
+    adapter._s3_client = client
+    return adapter
+
+
+def write_temp_file(data):
+    """Write data to a temporary file and return its path."""
+    fd, path = tempfile.mkstemp(suffix='.mp4')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def test_multipart_upload():
+    """Test that multipart uploads send every part in order."""
+    print("Testing multipart upload...")
+    
+    data = os.urandom(10_000)
+    path = write_temp_file(data)
+    try:
+        client = FakeS3Client()
+        adapter = make_adapter(client, multipart_threshold=0, part_size=1024, max_concurrency=4)
+        
+        content_hash = adapter._upload_to_s3(path, 'feedback/1/video.mp4')
+    finally:
+        os.remove(path)
+    
+    parts = client.completed['Parts']
+    assert [part['PartNumber'] for part in parts] == list(range(1, 11))
+    assert [part['ETag'] for part in parts] == [f'"etag-{n}"' for n in range(1, 11)]
+    assert b''.join(client.parts[n] for n in range(1, 11)) == data
+    assert content_hash == hashlib.sha256(data).hexdigest()
+    assert not client.aborted
+    
+    print("✓ Multipart upload test passed")
+
+
+def test_multipart_upload_abort():
+    """Test that a failed part aborts the multipart upload."""
+    print("Testing multipart upload abort...")
+    
+    path = write_temp_file(os.urandom(10_000))
+    try:
+        client = FakeS3Client(fail_part=3)
+        adapter = make_adapter(client, multipart_threshold=0, part_size=1024, max_concurrency=4)
+        
+        result = adapter.try_upload_video(path, 'feedback_1')
+    finally:
+        os.remove(path)
+    
+    assert not result.ok
+    assert 'part 3 failed' in result.error
+    assert client.aborted
+    assert client.completed is None
+    
+    print("✓ Multipart upload abort test passed")
+
+
+def test_multipart_buffer_reuse():
+    """Test that part buffers are pooled and reused across uploads."""
+    print("Testing multipart buffer reuse...")
+    
+    path = write_temp_file(os.urandom(10_240))
+    try:
+        first = FakeS3Client()
+        adapter = make_adapter(first, multipart_threshold=0, part_size=1024, max_concurrency=3)
+        adapter._upload_to_s3(path, 'feedback/1/video.mp4')
+        
+        second = FakeS3Client()
+        adapter._s3_client = second
+        adapter._upload_to_s3(path, 'feedback/2/video.mp4')
+    finally:
+        os.remove(path)
+    
+    # Full parts are sent from pooled buffers, at most one per worker
+    first_buffers = set(first.part_body_ids)
+    assert len(first_buffers) <= 3
+    assert set(second.part_body_ids) <= first_buffers
+    assert second.completed['Parts'] == first.completed['Parts']
+    
+    print("✓ Multipart buffer reuse test passed")
+
+
+def test_multipart_settings():
+    """Test that part size and concurrency stay within their bounds."""
+    print("Testing multipart settings...")
+    
+    adapter = CloudStorageAdapter({'provider': 'aws_s3'})
+    mb = 1024 * 1024
+    
+    for file_size in (1, 20 * mb, 700 * mb, 5 * 1024 * mb, 200 * 1024 * mb):
+        part_size, concurrency = adapter._multipart_settings(file_size)
+        assert part_size >= adapter.MIN_PART_SIZE
+        assert part_size % mb == 0
+        assert -(-file_size // part_size) <= adapter.TARGET_PART_COUNT
+        assert adapter.MIN_CONCURRENCY <= concurrency <= adapter.MAX_CONCURRENCY
+    
+    assert adapter._multipart_settings(1) == (adapter.MIN_PART_SIZE, adapter.MIN_CONCURRENCY)
+    assert adapter._multipart_settings(200 * 1024 * mb)[1] == adapter.MAX_CONCURRENCY
+    
+    # Configured values override the computed ones
+    adapter = CloudStorageAdapter({'provider': 'aws_s3', 'part_size': 8 * mb, 'max_concurrency': 2})
+    assert adapter._multipart_settings(5 * 1024 * mb) == (8 * mb, 2)
+    
+    print("✓ Multipart settings test passed")
+
+
+def test_notification_batching():
+    """Test that batched notifications are flushed in batches of max_batch."""
+    print("Testing notification batching...")
+    
+    batches = []
+    # A long delay means batches are only cut by size, flush() or close()
+    flusher = _NotificationFlusher(batches.append, max_batch=3, max_delay_ms=60_000)
+    for n in range(7):
+        flusher.put('feedback:uploaded', {'n': n})
+    
+    assert flusher.flush(timeout=5)
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [data['n'] for batch in batches for _, data in batch] == list(range(7))
+    
+    flusher.put('feedback:deleted', {'n': 7})
+    flusher.put('feedback:deleted', {'n': 8})
+    flusher.close()
+    assert [len(batch) for batch in batches] == [3, 3, 1, 2]
+    assert not flusher._thread.is_alive()
+    
+    # The notifier queues instead of publishing while batching is enabled
+    notifier = PubSubNotifier({'batching': True, 'max_batch': 10, 'max_delay_ms': 60_000})
+    published = []
+    notifier._flusher.publish_batch = published.append
+    assert notifier.notify_deletion('feedback_1', 'admin')
+    assert notifier.flush(timeout=5)
+    assert [event for batch in published for event, _ in batch] == [PubSubNotifier.EVENT_DELETED]
+    notifier.close()
+    assert notifier.flush() == True
+    
+    print("✓ Notification batching test passed")
+
+
+def test_async_upload_snapshot():
+    """Test that the async upload notification reports the PROCESSING state."""
+    print("Testing async upload...")
+    
+    orchestrator = FeedbackWorkflowOrchestrator({'provider': 'local'}, {})
+    orchestrator.probe.probe = lambda file_path: {'duration': 12.5, 'width': 1280, 'height': 720}
+    uploaded = []
+    processed = []
+    orchestrator.pubsub.notify_upload = uploaded.append
+    orchestrator.pubsub.notify_processing_complete = (
+        lambda feedback_id, status, metadata: processed.append((feedback_id, status, metadata))
+    )
+    
+    result = asyncio.run(orchestrator.process_upload_async('clip.mp4', 'clip.mp4', 1024, 'user_1'))
+    
+    assert result['success'] == True
+    assert result['metadata']['status'] == FeedbackStatus.READY
+    assert result['metadata']['resolution'] == '1280x720'
+    
+    # The upload notification gets a snapshot taken before probing finished
+    snapshot, = uploaded
+    assert snapshot.status == FeedbackStatus.PROCESSING
+    assert snapshot.width is None
+    assert snapshot.video_url == result['metadata']['video_url']
+    
+    (feedback_id, status, metadata), = processed
+    assert feedback_id == result['feedback_id']
+    assert status == FeedbackStatus.READY
+    assert metadata['duration'] == 12.5
+    
+    print("✓ Async upload test passed")
+
+
+def test_fast_validation_agrees():
+    """Test that validate_all_fast agrees with validate_all."""
+    print("Testing fast validation...")
+    
+    validator = VideoValidator
+    filenames = ['clip.mp4', 'CLIP.MOV', 'clip.webm', 'clip.avi', 'clip', '.mp4', 'a.b.mp4']
+    file_sizes = [0, 1, validator.MAX_FILE_SIZE, validator.MAX_FILE_SIZE + 1]
+    durations = [None, 0.5, validator.MIN_DURATION, validator.MAX_DURATION, validator.MAX_DURATION + 1]
+    
+    for filename in filenames:
+        for file_size in file_sizes:
+            for duration in durations:
+                is_valid, errors = validator.validate_all(filename, file_size, duration)
+                error = validator.validate_all_fast(filename, file_size, duration)
+                if is_valid:
+                    assert error is None, (filename, file_size, duration)
+                else:
+                    assert error == errors[0], (filename, file_size, duration)
+    
+    print("✓ Fast validation test passed")
+
+
+def test_compact_payloads():
+    """Test that PubSub payloads are compact JSON with or without orjson."""
+    print("Testing compact payloads...")
+    
+    payload = {'feedback_id': 'feedback_1', 'tags': ['asl', 'é'], 'views': None}
+    expected = '{"feedback_id":"feedback_1","tags":["asl","é"],"views":null}'
+    assert _dumps(payload) == expected
+    
+    original = feedback_workflow.orjson
+    feedback_workflow.orjson = None
+    try:
+        assert _dumps(payload) == expected
+    finally:
+        feedback_workflow.orjson = original
+    
+    print("✓ Compact payload test passed")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 80)
+    print("Running Feedback Workflow Tests")
+    print("=" * 80)
+    print()
+    
+    tests = [
+        test_multipart_upload,
+        test_multipart_upload_abort,
+        test_multipart_buffer_reuse,
+        test_multipart_settings,
+        test_notification_batching,
+        test_async_upload_snapshot,
+        test_fast_validation_agrees,
+        test_compact_payloads,
+    ]
+    
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ Test failed: {test.__name__}")
+            print(f"  Error: {str(e)}")
+            failed += 1
+        print()
+    
+    print("=" * 80)
+    if failed == 0:
+        print(f"All {len(tests)} tests passed! ✓")
+    else:
+        print(f"{failed} of {len(tests)} tests failed ✗")
+    print("=" * 80)
+    
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
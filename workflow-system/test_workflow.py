@@ -3,11 +3,14 @@ Simple tests to verify the workflow system functionality.
 Run with: python3 test_workflow.py
 """
 
+import json
+import os
 import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Make the core package importable however the tests are launched
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from core.workflow import (
     WorkflowBuilder,
@@ -16,7 +19,7 @@ from core.workflow import (
     EdgeConditionType,
     NodeType
 )
-from core.workflow_manager import WorkflowManager
+from core.workflow_manager import WorkflowManager, WorkflowRegistry
 
 
 def test_simple_workflow():
@@ -41,9 +44,7 @@ def test_simple_workflow():
     
     assert result['completed'] == True
     assert result['executed'] == True
-    assert 'start' in result['execution_path']
-    assert 'process' in result['execution_path']
-    assert 'end' in result['execution_path']
+    assert {'start', 'process', 'end'} <= set(result['execution_path'])
     
     print("✓ Simple workflow test passed")
 
@@ -99,6 +100,81 @@ def test_conditional_workflow():
     print("✓ Conditional workflow test passed")
 
 
+def test_edge_updates():
+    """Test that routing follows edges edited after they were added."""
+    print("Testing edge updates...")
+    
+    workflow = (
+        WorkflowBuilder('test_edges', 'Edge Update Test')
+        .add_start_node('start', 'Start')
+        .add_process_node('a', 'A')
+        .add_process_node('b', 'B')
+        .add_end_node('end', 'End')
+        .connect('start', 'a')
+        .connect('start', 'b', priority=1)
+        .connect('a', 'end')
+        .connect('b', 'end')
+        .build()
+    )
+    
+    assert workflow.get_next_nodes('start', {}) == ['b', 'a']
+    
+    edge_a, edge_b = workflow.get_outgoing_edges('start')[::-1]
+    edge_a.priority = 2
+    assert workflow.get_next_nodes('start', {}) == ['a', 'b']
+    
+    edge_b.condition = EdgeCondition(EdgeConditionType.EQUALS, 'go', True)
+    assert workflow.get_next_nodes('start', {}) == ['a']
+    assert workflow.get_next_nodes('start', {'go': True}) == ['a', 'b']
+    
+    edge_a.to_node = 'end'
+    assert workflow.get_next_nodes('start', {}) == ['end']
+    
+    print("✓ Edge update test passed")
+
+
+def test_parallel_workflow():
+    """Test running the nodes of a wave in parallel."""
+    print("Testing parallel workflow...")
+    
+    def left(context):
+        context['left'] = True
+        context['winner'] = 'left'
+        del context['scratch']
+        return context
+    
+    def right(context):
+        # Actions may also return a new mapping
+        return {**context, 'right': True, 'winner': 'right'}
+    
+    workflow = (
+        WorkflowBuilder('test_parallel', 'Parallel Test')
+        .add_start_node('start', 'Start')
+        .add_process_node('left', 'Left', left)
+        .add_process_node('right', 'Right', right)
+        .add_end_node('end', 'End')
+        .connect('start', 'left')
+        .connect('start', 'right')
+        .connect('left', 'end')
+        .connect('right', 'end')
+        .build()
+    )
+    
+    result = workflow.execute({'input': 1, 'scratch': True}, max_workers=2)
+    
+    assert result['completed'] == True
+    assert result['input'] == 1
+    assert result['left'] == True
+    assert result['right'] == True
+    # Keys set by several nodes keep the value of the last node in the wave
+    assert result['winner'] == 'right'
+    # Deletions are merged back too
+    assert 'scratch' not in result
+    assert result['execution_path'][:3] == ['start', 'left', 'right']
+    
+    print("✓ Parallel workflow test passed")
+
+
 def test_environment_workflow():
     """Test workflows with different environments."""
     print("Testing environment-specific workflows...")
@@ -164,6 +240,60 @@ def test_workflow_manager():
     print("✓ Workflow manager test passed")
 
 
+def test_execution_history_bound():
+    """Test that execution history stays within max_history."""
+    print("Testing execution history bound...")
+    
+    registry = WorkflowRegistry(max_history=3)
+    for workflow_id in ('a', 'b'):
+        registry.register(
+            WorkflowBuilder(workflow_id, workflow_id.upper())
+            .add_start_node('start', 'Start')
+            .add_end_node('end', 'End')
+            .connect('start', 'end')
+            .build()
+        )
+    
+    for _ in range(3):
+        registry.execute('a')
+    for _ in range(3):
+        registry.execute('b')
+    
+    assert len(registry.get_execution_history()) == 3
+    assert registry.get_execution_history('a') == []
+    assert len(registry.get_execution_history('b')) == 3
+    
+    registry.execute('a')
+    assert len(registry.get_execution_history('a')) == 1
+    assert len(registry.get_execution_history('b')) == 2
+    
+    # Counts only cover the records still kept
+    counts = registry.get_execution_counts()
+    assert counts['total'] == 3
+    assert counts['by_status'] == {'success': 3}
+    assert counts['by_environment'] == {'development': 3}
+    
+    # The history exposed by the registry is a read-only view
+    history = registry.execution_history
+    assert len(history) == 3
+    assert history[-1]['workflow_id'] == 'a'
+    assert not hasattr(history, 'append') and not hasattr(history, 'clear')
+    
+    # Unregistering keeps the workflow's records
+    registry.unregister('a')
+    assert len(registry.get_execution_history('a')) == 1
+    assert len(registry.get_execution_history()) == 3
+    
+    # A registry without history records nothing
+    empty = WorkflowRegistry(max_history=0)
+    empty.register(registry.workflows['b'])
+    empty.execute('b')
+    assert empty.get_execution_history('b') == []
+    assert empty.get_execution_counts()['total'] == 0
+    
+    print("✓ Execution history bound test passed")
+
+
 def test_custom_condition():
     """Test custom condition functionality."""
     print("Testing custom conditions...")
@@ -230,6 +360,10 @@ def test_workflow_validation():
     errors = workflow.validate()
     assert len(errors) == 0
     
+    # Edits made through the workflow's containers are seen
+    workflow.end_nodes.clear()
+    assert workflow.validate() == ["Workflow has no end nodes"]
+    
     # Test invalid workflow (no start node)
     try:
         workflow = (
@@ -272,8 +406,11 @@ def test_workflow_export():
     
     # Export to JSON
     json_str = workflow.to_json()
-    assert 'export_test' in json_str
-    assert 'staging' in json_str
+    assert json.loads(json_str) == data
+    
+    # Exports reflect later edits to nodes
+    workflow.nodes['process'].name = 'Renamed'
+    assert workflow.to_dict()['nodes']['process']['name'] == 'Renamed'
     
     print("✓ Workflow export test passed")
 
@@ -288,8 +425,11 @@ def run_all_tests():
     tests = [
         test_simple_workflow,
         test_conditional_workflow,
+        test_edge_updates,
+        test_parallel_workflow,
         test_environment_workflow,
         test_workflow_manager,
+        test_execution_history_bound,
         test_custom_condition,
         test_workflow_validation,
         test_workflow_export,